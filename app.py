@@ -1,14 +1,29 @@
-from flask import Flask, render_template, request, jsonify, g
+from flask import Flask, render_template, request, jsonify, g, Response, send_file
 from werkzeug.utils import secure_filename
 from flask_cors import CORS
+import io
 import os
-import sqlite3
+import json
+import threading
+import time
 import click
-from utilties.resume_parser.resume_parser import ResumeParser
+from utilties.resume_parser.resume_parser import ResumeParser, RESUME_PARSER_VERSION
+from utilties.resume_parser.model_registry import model_registry
+from utilties.job_description_parser.job_description_parser import JD_PARSER_VERSION
+from utilties.job_description_parser.job_description import JobDescription
+from utilties.parse_cache import ParseCache
+from utilties.storage import connect, thread_connection, release_connection, create_blob_table, store_blob, load_blob, release_blob, delete_orphan_blobs, migrate_inline_content
+from utilties.job_queue import JobQueue
+from utilties.upload_spool import spool_stream, UploadTooLarge
+from utilties.bulk_ingest import ingest
+from utilties.matching.match_engine import ResumeMatchIndex, JobRequirements, parse_list_field
+from utilties.matching.skill_index import create_skill_index_tables, store_resume_skills, backfill_resume_skills, rebuild_resume_skills, SkillPostingsIndex
+from utilties.matching.skill_embeddings import get_embedder, SemanticSkillMatcher, VectorIndex, build_skill_vector_index, build_resume_vector_index
+from utilties.resume_parser.skill_matcher import load_skill_vocabulary
 
 # Import the parser
 from main import get_parsed_resume_data
-from main import get_parsed_jd_data
+from main import get_parsed_jd_data, jd_parse_version
 
 
 app = Flask(__name__)
@@ -27,23 +42,61 @@ os.makedirs(DATABASE_FOLDER, exist_ok=True)
 
 app.config['UPLOAD_FOLDER_RESUME'] = UPLOAD_FOLDER_RESUME
 app.config['UPLOAD_FOLDER_JD'] = UPLOAD_FOLDER_JD
+# Threads used to run the resume field extractors concurrently (1 = serial)
+app.config['RESUME_PARSER_WORKERS'] = int(os.environ.get('RESUME_PARSER_WORKERS', 6))
+# Processes used to extract the pages of long PDFs (8+ pages) in parallel; 0 keeps it in-thread
+app.config['PDF_PAGE_WORKERS'] = int(os.environ.get('PDF_PAGE_WORKERS', 0))
+# Uploads are streamed into memory and hashed once; they are only written to the upload folders
+# (as <sha256>.pdf) when PERSIST_UPLOADS is set, since the database already keeps the bytes
+app.config['MAX_UPLOAD_BYTES'] = int(os.environ.get('MAX_UPLOAD_BYTES', 10 * 1024 * 1024))
+# Werkzeug spools a multipart body before request.files returns, so the limit has to be enforced
+# there too: a larger request is refused from its Content-Length (or once that many bytes have
+# arrived) without being read. The slack covers the multipart boundaries and part headers.
+app.config['MAX_CONTENT_LENGTH'] = app.config['MAX_UPLOAD_BYTES'] + 64 * 1024
+app.config['PERSIST_UPLOADS'] = os.environ.get('PERSIST_UPLOADS', '').lower() in ('1', 'true', 'yes')
 
 DB_PATH = os.path.join(DATABASE_FOLDER, 'app.db')
 
+# Parsed output of previously seen resumes/JDs, keyed by the SHA-256 of the PDF bytes
+app.config['PARSE_CACHE_MAX_ENTRIES'] = int(os.environ.get('PARSE_CACHE_MAX_ENTRIES', 5000))
+parse_cache = ParseCache(DB_PATH, max_entries=app.config['PARSE_CACHE_MAX_ENTRIES'])
+parse_cache.invalidate_other_versions('resume', RESUME_PARSER_VERSION)
+parse_cache.invalidate_other_versions('jd', JD_PARSER_VERSION)
+
+# The JD parser is deterministic and fast; set JD_LLM_ENRICHMENT to also fill gaps with the Ollama extractor
+app.config['JD_LLM_ENRICHMENT'] = os.environ.get('JD_LLM_ENRICHMENT', '').lower() in ('1', 'true', 'yes')
+# "ollama[:<model>]", or "fake[:<latency>]" for an offline deterministic stand-in
+app.config['JD_LLM_BACKEND'] = os.environ.get('JD_LLM_BACKEND', 'ollama')
+
+# Background parsing for async uploads; bounded to the number of cores by default
+app.config['PARSE_JOB_WORKERS'] = int(os.environ.get('PARSE_JOB_WORKERS', os.cpu_count() or 1))
+job_queue = JobQueue(max_workers=app.config['PARSE_JOB_WORKERS'])
+
+# Semantic skill matching: "hashing", "spacy:<package>" or "sentence-transformers:<model>" (all CPU, offline).
+# A backend set here must load; unset, en_core_web_md is used when installed and hashing otherwise.
+app.config['EMBEDDING_BACKEND'] = os.environ.get('EMBEDDING_BACKEND')
+EMBEDDINGS_FOLDER = os.path.join(DATABASE_FOLDER, 'embeddings')
+SKILL_VECTORS_PATH = os.path.join(EMBEDDINGS_FOLDER, 'skills')
+RESUME_VECTORS_PATH = os.path.join(EMBEDDINGS_FOLDER, 'resumes')
+
 # -----------------------
 # DB Functions
 # -----------------------
+def connect_db():
+    # A dedicated connection (WAL + pragmas) for long-running work such as bulk ingestion
+    return connect(DB_PATH)
+
 def get_db():
+    # Each server thread keeps one connection and reuses it across requests
     if 'db' not in g:
-        g.db = sqlite3.connect(DB_PATH)
-        g.db.row_factory = sqlite3.Row
+        g.db = thread_connection(DB_PATH)
     return g.db
 
 @app.teardown_appcontext
 def close_db(error):
     db = g.pop('db', None)
     if db:
-        db.close()
+        release_connection(db)
 
 # -----------------------
 # Init DB Tables
@@ -56,16 +109,24 @@ def init_db():
         CREATE TABLE IF NOT EXISTS job_descriptions (
             jd_id INTEGER PRIMARY KEY AUTOINCREMENT,
             title TEXT NOT NULL,
-            description BLOB NOT NULL
+            description BLOB NOT NULL,
+            parsed TEXT,
+            parsed_version TEXT
         )
     ''')
+    # Databases created before LLM extraction results were stored lack the parsed columns
+    jd_columns = {row[1] for row in cur.execute('PRAGMA table_info(job_descriptions)')}
+    if 'parsed' not in jd_columns:
+        cur.execute('ALTER TABLE job_descriptions ADD COLUMN parsed TEXT')
+    if 'parsed_version' not in jd_columns:
+        cur.execute('ALTER TABLE job_descriptions ADD COLUMN parsed_version TEXT')
 
     cur.execute('''
         CREATE TABLE IF NOT EXISTS resumes (
             resume_id INTEGER PRIMARY KEY AUTOINCREMENT,
             jd_id INTEGER,
             filename TEXT NOT NULL,
-            content BLOB NOT NULL,
+            content_digest TEXT NOT NULL,
             name TEXT NOT NULL,
             email TEXT NOT NULL,
             phone TEXT NOT NULL,
@@ -74,10 +135,26 @@ def init_db():
             institutions TEXT NOT NULL,
             majors TEXT NOT NULL,
             skills TEXT NOT NULL,
-            FOREIGN KEY(jd_id) REFERENCES job_descriptions(jd_id)
+            FOREIGN KEY(jd_id) REFERENCES job_descriptions(jd_id),
+            FOREIGN KEY(content_digest) REFERENCES resume_files(digest)
         )
     ''')
 
+    # Raw PDF bytes live in their own table, keyed by SHA-256, so scans over resumes never read them
+    create_blob_table(conn)
+    conn.commit()
+    migrated = migrate_inline_content(conn)
+    if migrated:
+        print(f"Moved the PDF content of {migrated} resumes into resume_files")
+
+    cur.execute('CREATE INDEX IF NOT EXISTS idx_resumes_jd_id ON resumes(jd_id)')
+    cur.execute('CREATE INDEX IF NOT EXISTS idx_resumes_email ON resumes(email)')
+    # Lets release_blob check whether any other resume still uses a file
+    cur.execute('CREATE INDEX IF NOT EXISTS idx_resumes_content_digest ON resumes(content_digest)')
+
+    # Normalized resume -> skill postings used for boolean skill filtering
+    create_skill_index_tables(conn)
+
     conn.commit()
 
 @app.cli.command('init-db')
@@ -86,85 +163,280 @@ def init_db_command():
         init_db()
     click.echo('Initialized the database.')
 
-# Load homepage 
-@app.route('/')
-def home():
-    return render_template('index.html')
+@app.cli.command('index-skills')
+@click.option('--rebuild', is_flag=True, help='Re-index every resume, e.g. after the skill taxonomy changed.')
+def index_skills_command(rebuild):
+    """Fill resume_skills for resumes stored before the skill index existed."""
+    with app.app_context():
+        init_db()
+        indexed = (rebuild_resume_skills if rebuild else backfill_resume_skills)(get_db())
+    click.echo(f'Indexed skills for {indexed} resumes.')
 
-#form
-@app.route('/upload_resume', methods=['POST'])
-def upload_resume():
-    if 'resume' not in request.files:
-        return jsonify({'message': 'Missing resume file'}), 400
+@app.cli.command('delete-orphan-files')
+def delete_orphan_files_command():
+    """Delete stored resume files that no resume points at any more."""
+    with app.app_context():
+        init_db()
+        conn = get_db()
+        deleted = delete_orphan_blobs(conn)
+        conn.commit()
+    click.echo(f'Deleted {deleted} orphaned resume files.')
+
+@app.cli.command('ingest-resumes')
+@click.argument('source')
+@click.option('--workers', type=int, default=None, help='Parser processes (default: number of cores).')
+@click.option('--batch-size', type=int, default=100, help='Resumes written per transaction.')
+@click.option('--chunk-size', type=int, default=8, help='Resumes each worker parses together.')
+@click.option('--jd-id', type=int, default=None, help='Link every ingested resume to this job description.')
+def ingest_resumes_command(source, workers, batch_size, chunk_size, jd_id):
+    """Parse every PDF in a directory or zip file and store them in the resumes table."""
+    with app.app_context():
+        init_db()
 
-    file = request.files['resume']
-    if file.filename == '':
-        return jsonify({'message': 'No selected file'}), 400
+    conn = connect_db()
 
-    filename = secure_filename(file.filename)
-    file_path = os.path.join(app.config['UPLOAD_FOLDER_RESUME'], filename)
-    file.save(file_path)
+    def store_batch(results):
+        # One transaction per batch instead of one per resume
+        with conn:
+            resume_skills = []
+            for result in results:
+                digest = store_blob(conn, result['content'])
+                cur = conn.execute(RESUME_INSERT_SQL, resume_row(result['filename'], digest, result['parsed'], jd_id))
+                resume_skills.append((cur.lastrowid, result['parsed'].get('skills', [])))
+            store_resume_skills(conn, resume_skills)
 
+    wait_for_model_warmup()
     try:
-        with open(file_path, 'rb') as f:
-            content = f.read()
+        report = ingest(source, store_batch, workers=workers, batch_size=batch_size, chunk_size=chunk_size, progress=click.echo)
+    finally:
+        conn.close()
+
+    click.echo(f"Stored {report['stored']}/{report['total']} resumes in {report['seconds']}s ({report['docs_per_sec']} docs/sec)")
+    for stage, seconds in sorted(report['avg_stage_seconds'].items()):
+        click.echo(f"  {stage:<18} {seconds:.4f}s avg")
+    if report['failed']:
+        click.echo(f"{len(report['failed'])} failed:")
+        for filename, error in report['failed']:
+            click.echo(f"  {filename}: {error}")
+
+@app.cli.command('build-embeddings')
+def build_embeddings_command():
+    """Embed the skill vocabulary and every stored resume into the on-disk vector indexes."""
+    embedder = get_embedder(app.config['EMBEDDING_BACKEND'])
+    skills = build_skill_vector_index(SKILL_VECTORS_PATH, embedder, load_skill_vocabulary('data/Skills.csv'))
+    click.echo(f'Embedded {len(skills)} skills with {embedder.name}.')
 
-        #function call from utilities to parse data using NLP (can be parsed without NLP too)
-        parsed_data = get_parsed_resume_data(content) 
-        
-        # resume_info=ResumeParser.extract_resume_info(parsed_data)
+    with app.app_context():
+        init_db()
+        rows = get_db().execute('SELECT resume_id, skills FROM resumes').fetchall()
+    resumes = build_resume_vector_index(RESUME_VECTORS_PATH, embedder, rows)
+    click.echo(f'Embedded {len(resumes)} resumes with {embedder.name}.')
 
-        if "first_name" in parsed_data:
-            first_name = parsed_data.get("first_name", "Unknown")
-        if "last_name" in parsed_data:
-            last_name=parsed_data.get("last_name", "Unknown")
-        name=first_name +" "+ last_name
+@app.cli.command('extract-jds')
+@click.option('--backend', default=None, help='LLM backend (default: JD_LLM_BACKEND).')
+@click.option('--concurrency', type=int, default=4, help='LLM requests in flight at once.')
+@click.option('--batch-size', type=int, default=64, help='JDs extracted together; each batch is stored before the next starts.')
+def extract_jds_command(backend, concurrency, batch_size):
+    """Run LLM enrichment over every stored JD and store the result, which /match then uses."""
+    from utilties.job_description_parser.jd_extractor import get_jd_extractor
 
-        if "email" in parsed_data:
-            email=parsed_data.get("email", "Unknown")
+    backend = backend or app.config['JD_LLM_BACKEND']
+    extractor = get_jd_extractor(backend, max_concurrency=concurrency, cache=parse_cache)
 
-        if "phone" in parsed_data:
-            phone=parsed_data.get("phone", "Unknown")
+    with app.app_context():
+        init_db()
+        conn = get_db()
+        rows = conn.execute('SELECT jd_id, description FROM job_descriptions ORDER BY jd_id').fetchall()
+
+        started = time.perf_counter()
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            texts = [jd_text(row['description']) for row in batch]
+            # Generates the whole batch concurrently into the LLM response cache; the enrichment
+            # below extracts from the same text, so it is answered from that cache
+            extractor.extract_many(texts)
+            parsed = [get_parsed_jd_data(text.encode('utf-8'), cache=parse_cache, use_llm=True, llm_backend=backend)
+                      for text in texts]
+            version = jd_parse_version(use_llm=True, llm_backend=backend)
+            with conn:
+                conn.executemany('UPDATE job_descriptions SET parsed = ?, parsed_version = ? WHERE jd_id = ?',
+                                 [(json.dumps(data), version, row['jd_id']) for data, row in zip(parsed, batch)])
+            click.echo(f"Extracted {min(start + batch_size, len(rows))}/{len(rows)} JDs")
+
+    elapsed = time.perf_counter() - started if rows else 0
+    click.echo(f"Done in {elapsed:.1f}s ({len(rows) / elapsed if elapsed else 0:.2f} JDs/sec)")
 
-        if "total_experience" in parsed_data:
-            total_experience= str(parsed_data.get("total_experience", "Unknown"))
+# -----------------------
+# Model warmup
+# -----------------------
+def warmup_models():
+    # Load the skill NER model once at startup so the first upload does not pay for it
+    try:
+        model_registry.warmup()
+    except Exception as e:
+        print("Model warmup error:", e)
 
-        if "degrees" in parsed_data:
-            degrees=str(parsed_data.get("degrees", "Unknown"))
+# Warmup starts when the app is imported, so it runs under `flask run`, gunicorn and `python app.py`
+# alike. It runs in the background; a request that needs the model meanwhile waits for the same load.
+app.config['WARMUP_MODELS'] = os.environ.get('WARMUP_MODELS', '1').lower() in ('1', 'true', 'yes')
+_warmup_thread = None
 
-        if "institutions" in parsed_data:
-            institutions=str(parsed_data.get("institutions", "Unknown"))
+def start_model_warmup():
+    global _warmup_thread
+    if _warmup_thread is None:
+        _warmup_thread = threading.Thread(target=warmup_models, name='model-warmup', daemon=True)
+        _warmup_thread.start()
 
-        if "majors" in parsed_data:
-            majors=str(parsed_data.get("majors", "Unknown"))
+def wait_for_model_warmup():
+    # Forking while the warmup thread holds the model registry lock would leave it held in the children
+    if _warmup_thread is not None:
+        _warmup_thread.join()
 
-        if "skills" in parsed_data:
-            skills=str(parsed_data.get("skills", "Unknown"))
-            
+if app.config['WARMUP_MODELS']:
+    start_model_warmup()
 
-        #database debugger
-        print("Inserting values:", (None, filename, name, email, phone, total_experience, degrees, institutions, majors, skills))
+@app.route('/model_status', methods=['GET'])
+def model_status():
+    return jsonify({'loaded_models': model_registry.memory_report()}), 200
 
-        conn = get_db()
-        cur = conn.cursor()
-        cur.execute(
-            'INSERT INTO resumes (jd_id, filename, content, name, email, phone, total_experience, degrees, institutions, majors, skills) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
-            (None, filename, content, name, email, phone, total_experience, degrees, institutions, majors, skills )
-        )
-        
-        resume_id = cur.lastrowid
-        conn.commit()
-        
-        return jsonify({
-            'message': f"File '{filename}' uploaded.",
-            'resume_id': resume_id,
-            'parsed_data': parsed_data
-        }), 200
+@app.route('/parse_cache/stats', methods=['GET'])
+def parse_cache_stats():
+    return jsonify(parse_cache.stats()), 200
+
+# Load homepage 
+@app.route('/')
+def home():
+    return render_template('index.html')
+
+RESUME_INSERT_SQL = 'INSERT INTO resumes (jd_id, filename, content_digest, name, email, phone, total_experience, degrees, institutions, majors, skills) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'
+
+def resume_row(filename, content_digest, parsed_data, jd_id=None):
+    name = parsed_data.get("first_name", "Unknown") + " " + parsed_data.get("last_name", "Unknown")
+    # The extractors return ""/None when nothing is found, but these columns are NOT NULL
+    email = parsed_data.get("email") or "Unknown"
+    phone = parsed_data.get("phone") or "Unknown"
+    total_experience = str(parsed_data.get("total_experience", "Unknown"))
+    degrees = str(parsed_data.get("degrees", "Unknown"))
+    institutions = str(parsed_data.get("institutions", "Unknown"))
+    majors = str(parsed_data.get("majors", "Unknown"))
+    skills = str(parsed_data.get("skills", "Unknown"))
+    return (jd_id, filename, content_digest, name, email, phone, total_experience, degrees, institutions, majors, skills)
+
+def store_parsed_resume(conn, filename, content, parsed_data, digest=None):
+    cur = conn.cursor()
+    row = resume_row(filename, store_blob(conn, content, digest), parsed_data)
+
+    #database debugger
+    print("Inserting values:", row)
+
+    cur.execute(RESUME_INSERT_SQL, row)
+    
+    resume_id = cur.lastrowid
+    store_resume_skills(conn, [(resume_id, parsed_data.get('skills', []))])
+    conn.commit()
+    return resume_id
+
+def process_resume(filename, content, digest=None):
+    """
+    Parses a resume and stores it. Runs inside a request or on a background job worker,
+    so it uses the calling thread's connection rather than the request-scoped one.
+    """
+    #function call from utilities to parse data using NLP (can be parsed without NLP too)
+    parsed_data = get_parsed_resume_data(content, max_workers=app.config['RESUME_PARSER_WORKERS'], cache=parse_cache, digest=digest,
+                                         page_workers=app.config['PDF_PAGE_WORKERS'])
+
+    conn = thread_connection(DB_PATH)
+    try:
+        resume_id = store_parsed_resume(conn, filename, content, parsed_data, digest)
+    finally:
+        release_connection(conn)
+
+    return {
+        'message': f"File '{filename}' uploaded.",
+        'resume_id': resume_id,
+        'parsed_data': parsed_data
+    }
+
+def spool_request_file(field):
+    """
+    Reads the uploaded file once into a SpooledUpload, or returns None when there is none.
+    Accepts a multipart form field, or a raw application/pdf body named by ?filename=,
+    which skips multipart buffering altogether.
+    """
+    max_bytes = app.config['MAX_UPLOAD_BYTES']
+    if request.mimetype == 'application/pdf':
+        filename = secure_filename(request.args.get('filename', '')) or 'upload.pdf'
+        return spool_stream(request.stream, filename, max_bytes, expected_size=request.content_length)
+
+    file = request.files.get(field)
+    if file is None or file.filename == '':
+        return None
+    return spool_stream(file.stream, secure_filename(file.filename), max_bytes)
+
+@app.errorhandler(413)
+def request_too_large(error):
+    return jsonify({'message': f"Upload exceeds the {app.config['MAX_UPLOAD_BYTES']} byte limit"}), 413
+
+#form
+@app.route('/upload_resume', methods=['POST'])
+def upload_resume():
+    try:
+        upload = spool_request_file('resume')
+    except UploadTooLarge as e:
+        return jsonify({'message': str(e)}), 413
+    if upload is None:
+        return jsonify({'message': 'Missing resume file'}), 400
+
+    filename, content = upload.filename, upload.buffer
+
+    try:
+        if app.config['PERSIST_UPLOADS']:
+            upload.persist(app.config['UPLOAD_FOLDER_RESUME'])
+
+        # ?async=1 hands parsing to the job queue and returns straight away
+        if request.args.get('async', '').lower() in ('1', 'true', 'yes'):
+            job_id = job_queue.submit(process_resume, filename, content, upload.digest)
+            return jsonify({
+                'message': f"File '{filename}' queued for parsing.",
+                'job_id': job_id,
+                'status_url': f"/jobs/{job_id}"
+            }), 202
+
+        return jsonify(process_resume(filename, content, upload.digest)), 200
 
     except Exception as e:
         print("Upload error:", e)
         return jsonify({'message': 'Internal error'}), 500
 
+@app.route('/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'message': 'Unknown job'}), 404
+    return jsonify(job), 200
+
+@app.route('/jobs/<job_id>/events', methods=['GET'])
+def job_events(job_id):
+    if job_queue.get(job_id) is None:
+        return jsonify({'message': 'Unknown job'}), 404
+
+    def stream():
+        # Server-sent events: one message per status change, ending once the job has finished
+        last_status = None
+        while True:
+            job = job_queue.wait_for_change(job_id, last_status)
+            if job is None:
+                break
+            if job['status'] != last_status:
+                last_status = job['status']
+                yield f"event: {last_status}\ndata: {json.dumps(job)}\n\n"
+            else:
+                yield ": keep-alive\n\n"
+            if last_status in ('done', 'failed'):
+                break
+
+    return Response(stream(), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache'})
+
 @app.route('/update_resume_info', methods=['POST'])
 def update_resume_info():
     data = request.get_json()
@@ -176,11 +448,16 @@ def update_resume_info():
 
     try:
         conn = get_db()
+        row = conn.execute('SELECT content_digest FROM resumes WHERE resume_id = ?', (resume_id,)).fetchone()
+        if row is None:
+            return jsonify({'message': 'Unknown resume_id'}), 404
         cur = conn.cursor()
         cur.execute(
-            'UPDATE resumes SET content = ? WHERE resume_id = ?',
-            (edited_text, resume_id)
+            'UPDATE resumes SET content_digest = ? WHERE resume_id = ?',
+            (store_blob(conn, edited_text), resume_id)
         )
+        # The replaced file is dropped unless another resume was uploaded with the same bytes
+        release_blob(conn, row['content_digest'])
         conn.commit()
         return jsonify({'message': 'Resume updated successfully'}), 200
     except Exception as e:
@@ -221,23 +498,23 @@ def add_jd():
     
 @app.route('/parse_jd_file', methods=['POST'])
 def parse_jd_file():
-    if 'jd_file' not in request.files:
+    try:
+        upload = spool_request_file('jd_file')
+    except UploadTooLarge as e:
+        return jsonify({'message': str(e)}), 413
+    if upload is None:
         return jsonify({'message': 'No JD file provided'}), 400
 
-    file = request.files['jd_file']
-    if file.filename == '':
-        return jsonify({'message': 'No selected file'}), 400
-
-    filename = secure_filename(file.filename)
-    file_path = os.path.join(app.config['UPLOAD_FOLDER_JD'], filename)
-    file.save(file_path)
+    filename = upload.filename
 
     try:
-        with open(file_path, 'rb') as f:
-            content = f.read()
+        if app.config['PERSIST_UPLOADS']:
+            upload.persist(app.config['UPLOAD_FOLDER_JD'])
 
         # Assuming your parse_jd_pdf function takes bytes and returns a string
-        parsed_description = get_parsed_jd_data(content)
+        parsed_description = get_parsed_jd_data(upload.buffer, cache=parse_cache, digest=upload.digest,
+                                                use_llm=app.config['JD_LLM_ENRICHMENT'],
+                                                llm_backend=app.config['JD_LLM_BACKEND'])
 
         return jsonify({
             'message': f"JD file '{filename}' parsed.",
@@ -248,6 +525,253 @@ def parse_jd_file():
         print("JD parse error:", e)
         return jsonify({'message': 'Internal JD parse error'}), 500
 
+# -----------------------
+# Matching
+# -----------------------
+_match_index = None
+_match_index_fingerprint = None
+_match_index_lock = threading.Lock()
+
+MATCH_INDEX_COLUMNS = 'resume_id, skills, majors, degrees, total_experience'
+
+def match_index_fingerprint(index):
+    # What (COUNT(*), MAX(resume_id)) over resumes was for the rows the index holds
+    return (len(index), int(index.resume_ids.max()) if len(index) else None)
+
+def get_match_index(conn):
+    """
+    Returns the in-memory ranking index. New uploads are appended to it; it is only rebuilt
+    from scratch when resumes were removed.
+    """
+    global _match_index, _match_index_fingerprint
+    fingerprint = tuple(conn.execute('SELECT COUNT(*), MAX(resume_id) FROM resumes').fetchone())
+    with _match_index_lock:
+        if _match_index is not None and fingerprint != _match_index_fingerprint:
+            # Resume IDs only grow, so the rows added since the last build are the ones above its highest ID
+            rows = conn.execute(f'SELECT {MATCH_INDEX_COLUMNS} FROM resumes WHERE resume_id > ? ORDER BY resume_id',
+                                (_match_index_fingerprint[1] or 0,)).fetchall()
+            if len(_match_index) + len(rows) == fingerprint[0]:
+                _match_index = _match_index.extended(rows)
+                _match_index_fingerprint = match_index_fingerprint(_match_index)
+        if _match_index is None or fingerprint != _match_index_fingerprint:
+            rows = conn.execute(f'SELECT {MATCH_INDEX_COLUMNS} FROM resumes').fetchall()
+            _match_index = ResumeMatchIndex(rows)
+            _match_index_fingerprint = match_index_fingerprint(_match_index)
+        return _match_index
+
+_skill_index = None
+_skill_index_fingerprint = None
+_skill_index_lock = threading.Lock()
+
+def get_skill_index(conn):
+    global _skill_index, _skill_index_fingerprint
+    # Resumes without skills widen none-only queries, so they change the index too
+    fingerprint = tuple(conn.execute(
+        'SELECT (SELECT COUNT(*) FROM resume_skills), (SELECT COUNT(*) FROM resumes), (SELECT MAX(resume_id) FROM resumes)'
+    ).fetchone())
+    with _skill_index_lock:
+        if _skill_index is None or fingerprint != _skill_index_fingerprint:
+            _skill_index = SkillPostingsIndex(conn)
+            _skill_index_fingerprint = fingerprint
+        return _skill_index
+
+def skill_list_arg(name):
+    return [s for s in request.args.get(name, '').split(',') if s.strip()]
+
+def skill_filter_args():
+    return skill_list_arg('all'), skill_list_arg('any'), skill_list_arg('none')
+
+RESUME_LIST_COLUMNS = 'resume_id, jd_id, filename, name, email, phone, total_experience, degrees, institutions, majors, skills'
+
+@app.route('/resumes', methods=['GET'])
+def list_resumes():
+    # Filters hit idx_resumes_jd_id / idx_resumes_email; PDF bytes are never read here
+    limit = min(request.args.get('limit', 50, type=int), 500)
+    offset = request.args.get('offset', 0, type=int)
+    clauses, params = [], []
+    if request.args.get('jd_id') is not None:
+        clauses.append('jd_id = ?')
+        params.append(request.args.get('jd_id', type=int))
+    if request.args.get('email'):
+        clauses.append('email = ?')
+        params.append(request.args['email'])
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+
+    try:
+        rows = get_db().execute(
+            f'SELECT {RESUME_LIST_COLUMNS} FROM resumes {where} ORDER BY resume_id LIMIT ? OFFSET ?',
+            params + [limit, offset]
+        ).fetchall()
+        return jsonify({'resumes': [dict(row) for row in rows]}), 200
+    except Exception as e:
+        print("List error:", e)
+        return jsonify({'message': 'Failed to list resumes'}), 500
+
+@app.route('/resumes/<int:resume_id>/file', methods=['GET'])
+def resume_file(resume_id):
+    conn = get_db()
+    row = conn.execute('SELECT filename, content_digest FROM resumes WHERE resume_id = ?', (resume_id,)).fetchone()
+    content = load_blob(conn, row['content_digest']) if row else None
+    if content is None:
+        return jsonify({'message': 'Unknown resume_id'}), 404
+    mimetype = 'application/pdf' if content.startswith(b'%PDF') else 'text/plain'
+    # send_file quotes the stored filename for Content-Disposition (RFC 6266 filename*= for non-ASCII)
+    return send_file(io.BytesIO(content), mimetype=mimetype, download_name=row['filename'])
+
+@app.route('/resumes/search', methods=['GET'])
+def search_resumes():
+    all_of, any_of, none_of = skill_filter_args()
+    if not (all_of or any_of or none_of):
+        return jsonify({'message': 'Give at least one of all/any/none skill lists'}), 400
+
+    try:
+        resume_ids = get_skill_index(get_db()).query(all_of, any_of, none_of)
+        return jsonify({'count': int(len(resume_ids)), 'resume_ids': resume_ids.tolist()}), 200
+    except Exception as e:
+        print("Search error:", e)
+        return jsonify({'message': 'Failed to search resumes'}), 500
+
+def jd_text(description):
+    return description.decode('utf-8', errors='ignore') if isinstance(description, bytes) else (description or "")
+
+def jd_requirements(conn, jd):
+    """
+    JobRequirements for a stored JD row: the result `flask extract-jds` stored, otherwise the
+    deterministic JD parser's (cached by content). A stored result from an older parser version
+    is redone with the same LLM backend and stored again, as the parse cache would.
+    """
+    if jd['parsed']:
+        # Results stored before versions were recorded name no backend; they are always stale
+        backend = (jd['parsed_version'] or '').partition('+')[2] or app.config['JD_LLM_BACKEND']
+        version = jd_parse_version(use_llm=True, llm_backend=backend)
+        if jd['parsed_version'] == version:
+            parsed = json.loads(jd['parsed'])
+        else:
+            parsed = get_parsed_jd_data(jd_text(jd['description']).encode('utf-8'), cache=parse_cache,
+                                        use_llm=True, llm_backend=backend)
+            with conn:
+                conn.execute('UPDATE job_descriptions SET parsed = ?, parsed_version = ? WHERE jd_id = ?',
+                             (json.dumps(parsed), version, jd['jd_id']))
+    else:
+        parsed = get_parsed_jd_data(jd_text(jd['description']).encode('utf-8'), cache=parse_cache)
+    parsed = JobDescription(**parsed)
+    return JobRequirements.from_job_description(parsed, majors=parsed.majors)
+
+@app.route('/match/<int:jd_id>', methods=['GET'])
+def match_resumes(jd_id):
+    top_k = request.args.get('k', 10, type=int)
+    if top_k < 1:
+        return jsonify({'message': 'k must be at least 1'}), 400
+
+    try:
+        conn = get_db()
+        jd = conn.execute('SELECT jd_id, title, description, parsed, parsed_version FROM job_descriptions WHERE jd_id = ?', (jd_id,)).fetchone()
+        if jd is None:
+            return jsonify({'message': 'Unknown jd_id'}), 404
+
+        requirements = jd_requirements(conn, jd)
+
+        # Optional boolean skill prefilter (?all=...&any=...&none=...) narrows the candidates before scoring
+        all_of, any_of, none_of = skill_filter_args()
+        candidate_ids = get_skill_index(conn).query(all_of, any_of, none_of) if (all_of or any_of or none_of) else None
+
+        match_index = get_match_index(conn)
+        top_k = min(top_k, len(candidate_ids) if candidate_ids is not None else len(match_index))
+        matches = match_index.rank(requirements, top_k=top_k, candidate_ids=candidate_ids) if top_k else []
+
+        if matches:
+            ids = [m['resume_id'] for m in matches]
+            placeholders = ','.join('?' * len(ids))
+            names = {row['resume_id']: row for row in conn.execute(
+                f'SELECT resume_id, name, email FROM resumes WHERE resume_id IN ({placeholders})', ids
+            )}
+            for match in matches:
+                match['name'] = names[match['resume_id']]['name']
+                match['email'] = names[match['resume_id']]['email']
+
+        return jsonify({
+            'jd_id': jd_id,
+            'title': jd['title'],
+            'required_skills': requirements.skills,
+            'matches': matches
+        }), 200
+    except Exception as e:
+        print("Match error:", e)
+        return jsonify({'message': 'Failed to rank resumes'}), 500
+
+_semantic = None
+_semantic_fingerprint = None
+_semantic_lock = threading.Lock()
+
+def vector_manifest_fingerprint():
+    return tuple(os.stat(path + '.json').st_mtime_ns if os.path.exists(path + '.json') else None
+                 for path in (RESUME_VECTORS_PATH, SKILL_VECTORS_PATH))
+
+def get_semantic_matcher():
+    """
+    Loads the embedder and the memory-mapped vector indexes written by `flask build-embeddings`,
+    using the embedder they were built with so query vectors live in the same space. Reloads
+    them when a rebuild has replaced either manifest.
+    """
+    global _semantic, _semantic_fingerprint
+    fingerprint = vector_manifest_fingerprint()
+    with _semantic_lock:
+        if _semantic is None or fingerprint != _semantic_fingerprint:
+            resume_vectors = VectorIndex.load(RESUME_VECTORS_PATH).build_approximate()
+            skill_vectors = VectorIndex.load(SKILL_VECTORS_PATH) if os.path.exists(SKILL_VECTORS_PATH + '.json') else None
+            embedder = get_embedder(resume_vectors.embedder_name or app.config['EMBEDDING_BACKEND'])
+            _semantic = (SemanticSkillMatcher(embedder, skill_vectors), resume_vectors)
+            _semantic_fingerprint = fingerprint
+        return _semantic
+
+@app.route('/match/<int:jd_id>/semantic', methods=['GET'])
+def semantic_match_resumes(jd_id):
+    top_k = request.args.get('k', 10, type=int)
+    if top_k < 1:
+        return jsonify({'message': 'k must be at least 1'}), 400
+    exact = request.args.get('exact', '0') == '1'
+
+    try:
+        conn = get_db()
+        jd = conn.execute('SELECT jd_id, title, description, parsed, parsed_version FROM job_descriptions WHERE jd_id = ?', (jd_id,)).fetchone()
+        if jd is None:
+            return jsonify({'message': 'Unknown jd_id'}), 404
+        if not os.path.exists(RESUME_VECTORS_PATH + '.json'):
+            return jsonify({'message': 'No vector index yet, run `flask build-embeddings`'}), 409
+
+        requirements = jd_requirements(conn, jd)
+        matcher, resume_vectors = get_semantic_matcher()
+        query = matcher.skill_list_vector(requirements.skills)
+        if query is None:
+            return jsonify({'message': 'No skills found in the job description'}), 422
+
+        matches = [{'resume_id': resume_id, 'similarity': round(similarity, 4)}
+                   for resume_id, similarity in resume_vectors.search(query, k=min(top_k, len(resume_vectors)), exact=exact)]
+
+        if matches:
+            ids = [m['resume_id'] for m in matches]
+            placeholders = ','.join('?' * len(ids))
+            rows = {row['resume_id']: row for row in conn.execute(
+                f'SELECT resume_id, name, email, skills FROM resumes WHERE resume_id IN ({placeholders})', ids
+            )}
+            # Resumes deleted since the index was built are dropped
+            matches = [m for m in matches if m['resume_id'] in rows]
+            for match in matches:
+                row = rows[match['resume_id']]
+                match['name'] = row['name']
+                match['email'] = row['email']
+                match['skill_coverage'] = round(matcher.coverage(requirements.skills, parse_list_field(row['skills'])), 4)
+
+        return jsonify({
+            'jd_id': jd_id,
+            'title': jd['title'],
+            'required_skills': requirements.skills,
+            'matches': matches
+        }), 200
+    except Exception as e:
+        print("Semantic match error:", e)
+        return jsonify({'message': 'Failed to rank resumes'}), 500
+
 # -----------------------
 # Run the App
 # -----------------------
@@ -0,0 +1,90 @@
+"""
+Throughput of batched LLM JD extraction, using the deterministic fake backend with a simulated
+generation latency, plus the effect of the response cache on a second run and of stopping the
+stream when the JSON object closes and of chunking long JDs.
+
+Run from the repository root:
+    python -m benchmarks.bench_jd_extraction
+"""
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utilties.job_description_parser.jd_extractor import CHUNK_CHARS, JobDescriptionExtractor
+from utilties.job_description_parser.llm_backends import FakeBackend
+from utilties.parse_cache import ParseCache
+
+CORPUS = "data/dataturks_resume_ner.json"
+
+
+def load_texts(limit=200):
+    # Resumes stand in for JDs: what matters here is prompt size and count, not content
+    with open(CORPUS, encoding='utf-8') as f:
+        return [item["text"][:3000] for item in json.load(f)[:limit]]
+
+
+def load_long_texts(count=10, length=30000):
+    # Long postings: consecutive corpus documents joined until each is `length` characters
+    with open(CORPUS, encoding='utf-8') as f:
+        texts = [item["text"] for item in json.load(f)]
+    joined = "\n\n".join(texts)
+    return [joined[i * length:(i + 1) * length] for i in range(count)]
+
+
+def run(extractor, texts):
+    start = time.perf_counter()
+    extractor.extract_many(texts)
+    return time.perf_counter() - start
+
+
+def main(n=200, latency=0.05):
+    texts = load_texts(n)
+    print(f"{len(texts)} documents, simulated latency {latency * 1000:.0f} ms per generation\n")
+
+    for concurrency in (1, 4, 16):
+        extractor = JobDescriptionExtractor(backend=FakeBackend(latency=latency), max_concurrency=concurrency)
+        seconds = run(extractor, texts)
+        print(f"  concurrency {concurrency:>2}: {seconds:6.2f} s ({len(texts) / seconds:7.1f} docs/sec)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ParseCache(os.path.join(tmp, "cache.db"), max_entries=10_000)
+        backend = FakeBackend(latency=latency)
+        extractor = JobDescriptionExtractor(backend=backend, cache=cache, max_concurrency=16)
+        cold = run(extractor, texts)
+        calls = backend.calls
+        warm = run(extractor, texts)
+        print(f"\n  cold cache: {cold:6.2f} s, {calls} generations")
+        print(f"  warm cache: {warm:6.2f} s, {backend.calls - calls} generations")
+
+    # An unconstrained model that keeps talking after the object: reading every response to the
+    # end against closing the stream at the object's closing brace
+    chatter = " Let me know if you need anything else about this role." * 20
+    backend = FakeBackend(latency=latency, trailing_text=chatter)
+    backend.supports_json_schema = False
+    extractor = JobDescriptionExtractor(backend=backend, max_concurrency=16)
+    prompts = [extractor.build_prompt(text) for text in texts]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(backend.invoke, prompts))
+    full_seconds, full_chunks = time.perf_counter() - start, backend.chunks
+
+    early_seconds = run(extractor, texts)
+    print(f"\n  read to the end : {full_seconds:6.2f} s, {full_chunks} chunks")
+    print(f"  stop at the '}}': {early_seconds:6.2f} s, {backend.chunks - full_chunks} chunks")
+
+    # Latency of a single long JD, with prompt processing at 20 ms per 1000 characters: one prompt
+    # for the whole text against section chunks of CHUNK_CHARS extracted in parallel
+    long_texts = load_long_texts()
+    print(f"\n{len(long_texts)} long documents of {len(long_texts[0])} characters, one at a time")
+    for max_chunk_chars in (10 ** 9, CHUNK_CHARS):
+        backend = FakeBackend(latency=latency, prompt_latency=0.02)
+        extractor = JobDescriptionExtractor(backend=backend, max_concurrency=16, max_chunk_chars=max_chunk_chars)
+        seconds = sum(run(extractor, [text]) for text in long_texts)
+        label = "one prompt" if max_chunk_chars == 10 ** 9 else f"chunks of {max_chunk_chars}"
+        print(f"  {label:<15}: {seconds / len(long_texts) * 1000:6.0f} ms/doc, {backend.calls / len(long_texts):.1f} prompts/doc")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Recall and latency of the approximate (inverted-file) vector search against the exact
+brute-force scan, plus the cost of embedding the skill vocabulary.
+
+Run from the repository root:
+    python -m benchmarks.bench_skill_embeddings [embedder spec, e.g. spacy:en_core_web_md]
+"""
+import sys
+import tempfile
+import time
+import numpy as np
+
+from utilties.matching.skill_embeddings import VectorIndex, get_embedder, normalize_rows
+from utilties.resume_parser.skill_matcher import load_skill_vocabulary
+
+SKILLS_CSV = "data/Skills.csv"
+
+
+def clustered_vectors(n, dim, n_clusters=500, noise=0.15, seed=0):
+    # Resume vectors cluster around role profiles, so uniform noise would flatter neither method
+    rng = np.random.default_rng(seed)
+    centers = normalize_rows(rng.standard_normal((n_clusters, dim)))
+    labels = rng.integers(n_clusters, size=n)
+    return normalize_rows(centers[labels] + noise * rng.standard_normal((n, dim)) / np.sqrt(dim) * 4)
+
+
+def time_queries(index, queries, k, exact):
+    start = time.perf_counter()
+    results = [index.search(q, k, exact=exact) for q in queries]
+    return results, (time.perf_counter() - start) / len(queries) * 1000
+
+
+def main(spec="hashing", n=100_000, dim=300, n_queries=200, k=10):
+    vocabulary = load_skill_vocabulary(SKILLS_CSV)
+    embedder = get_embedder(spec)
+    start = time.perf_counter()
+    embedder.embed(vocabulary)
+    print(f"Embedded {len(vocabulary)} skills with {embedder.name} in {time.perf_counter() - start:.2f} s")
+
+    vectors = clustered_vectors(n, dim)
+    rng = np.random.default_rng(1)
+    queries = normalize_rows(vectors[rng.integers(n, size=n_queries)] + 0.05 * rng.standard_normal((n_queries, dim)))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = VectorIndex.build(f"{tmp}/bench", list(range(n)), vectors)
+        exact, exact_ms = time_queries(index, queries, k, exact=True)
+
+        start = time.perf_counter()
+        index.build_approximate()
+        build_s = time.perf_counter() - start
+        approx, approx_ms = time_queries(index, queries, k, exact=False)
+
+    recall = np.mean([
+        len({key for key, _ in a} & {key for key, _ in e}) / k for a, e in zip(approx, exact)
+    ])
+    print(f"{n} x {dim} float32 vectors (memory-mapped)")
+    print(f"  exact scan  : {exact_ms:7.2f} ms/query")
+    print(f"  IVF (approx): {approx_ms:7.2f} ms/query, recall@{k} = {recall:.3f}, build {build_s:.2f} s")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
@@ -1,17 +1,57 @@
-from utilties.job_description_parser.job_description_parser import JobDescriptionParser
-from utilties.resume_parser.resume_parser import ResumeParser
+from utilties.job_description_parser.job_description_parser import JobDescriptionParser, JD_PARSER_VERSION, jd_text_from_input, merge_job_descriptions
+from utilties.resume_parser.resume_parser import ResumeParser, RESUME_PARSER_VERSION
 import os
 
-def get_parsed_resume_data(resume_text):
-    resume_parser = ResumeParser(resume_binary=resume_text)
-    resume_data = resume_parser.parse()
-    return resume_data
+def get_parsed_resume_data(resume_text, max_workers=None, cache=None, digest=None, page_workers=None):
+    def parse():
+        resume_parser = ResumeParser(resume_binary=resume_text, max_workers=max_workers, page_workers=page_workers)
+        return resume_parser.parse()
 
-def get_parsed_jd_data(jd_text):
-    # Dummy implementation; replace with actual logic
-    return {
-        "Skills": ["Python", "MLOps", "Machine Learning", "NLP"]
-    }
+    # Re-uploads of the same PDF are answered from the content-hash cache
+    if cache is None:
+        return parse()
+
+    # Timings describe one parse; they are not cached, so a hit reports none instead of the first parse's
+    timings = {}
+    def parse_without_timings():
+        result = parse()
+        timings.update(result.pop('timings', {}))
+        return result
+
+    result = cache.get_or_compute('resume', RESUME_PARSER_VERSION, resume_text, parse_without_timings, digest=digest)
+    return dict(result, timings=timings)
+
+def get_parsed_jd_data(jd_text, cache=None, digest=None, use_llm=False, llm_backend="ollama"):
+    def parse():
+        job_description = JobDescriptionParser(jd_text).parse()
+        if use_llm:
+            job_description = enrich_with_llm(job_description, jd_text, llm_backend, cache)
+        return job_description.model_dump()
+
+    if cache is None:
+        return parse()
+    return cache.get_or_compute('jd', jd_parse_version(use_llm, llm_backend), jd_text, parse, digest=digest)
+
+def jd_parse_version(use_llm=False, llm_backend="ollama"):
+    # The LLM tier produces different output, so it is versioned (and cached) separately
+    return f"{JD_PARSER_VERSION}+{llm_backend}" if use_llm else JD_PARSER_VERSION
+
+def enrich_with_llm(job_description, jd_text, llm_backend="ollama", cache=None):
+    """
+    Optional slow tier: asks the LLM extractor for the same fields and fills in whatever the
+    deterministic parser left empty. Any LLM failure leaves the fast result untouched.
+    """
+    try:
+        from utilties.job_description_parser.jd_extractor import get_jd_extractor
+        text, heading_lines = jd_text_from_input(jd_text)
+        enriched = get_jd_extractor(llm_backend, cache=cache).extract_from_text(text, heading_lines)
+    except Exception as e:
+        print(f"[ERROR] LLM JD enrichment failed: {e}")
+        return job_description
+    # The extractor reports its own failures as a placeholder rather than raising
+    if enriched.job_title == "Manual Review Required":
+        return job_description
+    return merge_job_descriptions(job_description, enriched)
 
 # def main():
 #     # Example usage
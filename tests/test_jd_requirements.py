@@ -0,0 +1,32 @@
+from utilties.job_description_parser.job_description_parser import JobDescriptionParser
+from utilties.matching.match_engine import JobRequirements
+
+
+def ui_stored_description(parsed):
+    # Mirrors uploadJDFile in static/index.js, which stores a parsed JD file as "key: value" lines
+    return "".join(
+        f"{key}: {', '.join(value) if isinstance(value, list) else ('null' if value is None else value)}\n"
+        for key, value in parsed.items()
+    )
+
+
+def test_jd_stored_through_the_ui_keeps_its_requirements():
+    description = ui_stored_description({
+        "job_title": "Backend Engineer",
+        "company_name": None,
+        "location": "Remote",
+        "experience_required": "3+ years",
+        "education_level": "B.Tech",
+        "technical_skills": ["Python", "Docker"],
+        "responsibilities": ["Build APIs"],
+        "salary_range": None,
+    })
+
+    parsed = JobDescriptionParser(description.encode("utf-8")).parse()
+    requirements = JobRequirements.from_job_description(parsed)
+
+    assert parsed.job_title == "Backend Engineer"
+    assert parsed.company_name is None
+    assert requirements.experience_months > 0
+    assert requirements.degree_rank > 0
+    assert set(requirements.skills) >= {"Python", "Docker"}
@@ -0,0 +1,37 @@
+from utilties.job_description_parser.job_description_parser import JobDescriptionParser
+from utilties.resume_parser.skill_matcher import get_skill_matcher, load_skill_vocabulary
+from utilties.resume_parser.skill_taxonomy import get_skill_taxonomy
+
+
+def matched_skills(text):
+    taxonomy = get_skill_taxonomy()
+    return {taxonomy.canonical(match.keyword) for match in get_skill_matcher().find_all(text)}
+
+
+def test_bracketed_vocabulary_entries_match_their_plain_names():
+    # Skills.csv lists "Rust (Programming language focused on performance and safety)"
+    text = "Services in Rust and Apache Kafka, dashboards in Kibana, NLP pipelines in Python."
+
+    assert matched_skills(text) >= {"Rust", "Apache Kafka", "Kibana", "Natural Language Processing (NLP)", "Python"}
+
+
+def test_every_vocabulary_skill_can_be_matched():
+    taxonomy = get_skill_taxonomy()
+
+    for name in load_skill_vocabulary("data/Skills.csv"):
+        shown = taxonomy.canonical(name)
+        assert shown in matched_skills(shown), name
+
+
+def test_jd_technical_skills_include_bracketed_entries():
+    description = "Data Engineer\n\nWe build streaming jobs on Apache Kafka and Rust, with Kibana dashboards and NLP."
+
+    parsed = JobDescriptionParser(description.encode("utf-8")).parse()
+
+    assert {"Apache Kafka", "Rust", "Kibana", "Natural Language Processing (NLP)"} <= set(parsed.technical_skills)
+
+
+def test_aliases_are_matched_in_text():
+    text = "Deployed Golang services on K8s backed by Postgres."
+
+    assert matched_skills(text) >= {"Go", "Kubernetes", "PostgreSQL"}
@@ -0,0 +1,137 @@
+import os
+import time
+import zipfile
+from collections import defaultdict
+from multiprocessing import Pool
+
+from utilties.resume_parser.pdf_text import extract_pdf_text
+from utilties.resume_parser.resume_document import ResumeDocument
+from utilties.resume_parser.resume_parser import ResumeParser
+
+
+def list_pdf_sources(source):
+    """
+    Returns (source, member) pairs for every PDF in a directory tree or a zip archive.
+    member is None for plain files and the archive entry name for zips.
+    """
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            return [(source, name) for name in archive.namelist() if name.lower().endswith('.pdf')]
+
+    if os.path.isdir(source):
+        paths = []
+        for root, _, files in os.walk(source):
+            paths.extend(os.path.join(root, name) for name in files if name.lower().endswith('.pdf'))
+        return [(path, None) for path in sorted(paths)]
+
+    raise ValueError(f"{source} is neither a directory nor a zip file")
+
+
+def read_pdf_source(path, member):
+    if member is None:
+        with open(path, 'rb') as f:
+            return os.path.basename(path), f.read()
+    with zipfile.ZipFile(path) as archive:
+        return os.path.basename(member), archive.read(member)
+
+
+def init_worker(warmup=True):
+    """
+    Runs once per worker process: load the spaCy and transformers models up front
+    so every resume the process handles reuses them.
+    """
+    if not warmup:
+        return
+    from utilties.resume_parser.model_registry import model_registry
+    from utilties.resume_parser.nlp_provider import get_nlp
+    try:
+        get_nlp()
+        model_registry.warmup()
+    except Exception as e:
+        print(f"[ERROR] Worker warmup failed: {e}")
+
+
+def parse_chunk(items):
+    """
+    Parses a chunk of PDFs together, so the model-backed extractors see every resume in the
+    chunk at once. A PDF that cannot be read fails on its own; if the batched extractors fail,
+    the chunk is parsed again one resume at a time to find the culprit.
+    """
+    parser = ResumeParser()
+    results, loaded = [], []
+    for path, member in items:
+        filename = member or path
+        try:
+            filename, content = read_pdf_source(path, member)
+            start = time.perf_counter()
+            pdf_text = extract_pdf_text(content)
+            loaded.append((filename, content, pdf_text, round(time.perf_counter() - start, 4)))
+        except Exception as e:
+            results.append({'filename': filename, 'content': None, 'parsed': None, 'error': str(e)})
+
+    try:
+        parsed = parser.extract_resume_info_batch([ResumeDocument(pdf_text.text, pdf_text.heading_lines)
+                                                   for _, _, pdf_text, _ in loaded])
+    except Exception:
+        parsed = [None] * len(loaded)
+
+    for (filename, content, pdf_text, pdf_seconds), resume_info in zip(loaded, parsed):
+        try:
+            resume_info = resume_info or parser.extract_resume_info(pdf_text.text, pdf_text.heading_lines)
+            resume_info['timings']['pdf_text'] = pdf_seconds
+            results.append({'filename': filename, 'content': content, 'parsed': resume_info, 'error': None})
+        except Exception as e:
+            results.append({'filename': filename, 'content': None, 'parsed': None, 'error': str(e)})
+    return results
+
+
+def ingest(source, store_batch, workers=None, batch_size=100, chunk_size=8, warmup=True, progress=print):
+    """
+    Parses every PDF under `source` on a process pool, chunk_size PDFs per task, and hands successful
+    results to store_batch(results) in groups of batch_size, so the caller can write each group in
+    one transaction.
+
+    Returns a report with throughput, failures and the average time per extraction stage.
+    """
+    items = list_pdf_sources(source)
+    workers = workers or os.cpu_count() or 1
+    progress(f"Found {len(items)} PDFs, parsing with {workers} worker processes")
+
+    started = time.perf_counter()
+    stage_totals = defaultdict(float)
+    failures = []
+    stored = 0
+    batch = []
+
+    with Pool(processes=workers, initializer=init_worker, initargs=(warmup,)) as pool:
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+        for chunk_results in pool.imap_unordered(parse_chunk, chunks):
+            for result in chunk_results:
+                if result['error'] is not None:
+                    failures.append((result['filename'], result['error']))
+                    continue
+
+                for stage, seconds in result['parsed'].get('timings', {}).items():
+                    stage_totals[stage] += seconds
+
+                batch.append(result)
+                if len(batch) >= batch_size:
+                    store_batch(batch)
+                    stored += len(batch)
+                    batch = []
+                    elapsed = time.perf_counter() - started
+                    progress(f"Stored {stored}/{len(items)} ({stored / elapsed:.2f} docs/sec)")
+
+        if batch:
+            store_batch(batch)
+            stored += len(batch)
+
+    elapsed = time.perf_counter() - started
+    return {
+        'total': len(items),
+        'stored': stored,
+        'failed': failures,
+        'seconds': round(elapsed, 2),
+        'docs_per_sec': round(stored / elapsed, 2) if elapsed else 0.0,
+        'avg_stage_seconds': {stage: round(total / stored, 4) for stage, total in stage_totals.items()} if stored else {}
+    }
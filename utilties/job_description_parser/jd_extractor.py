@@ -1,40 +1,17 @@
-from typing import Optional, List
-from pydantic import BaseModel, Field
-from langchain.prompts import ChatPromptTemplate
-from langchain.output_parsers import PydanticOutputParser
-from langchain.schema.runnable import RunnablePassthrough
-from langchain_ollama import OllamaLLM
-from langchain_community.document_loaders import PyMuPDFLoader
-
-class JobDescription(BaseModel):
-    job_title: str = Field(default="Not specified", description="The main job title/position")
-    company_name: Optional[str] = Field(default=None, description="Company name")
-    location: Optional[str] = Field(default=None, description="Job location")
-    job_type: Optional[str] = Field(default=None, description="Employment type")
-    experience_required: Optional[str] = Field(default=None, description="Required experience")
-    education_level: Optional[str] = Field(default=None, description="Required education")
-    technical_skills: List[str] = Field(default_factory=list, description="Technical skills")
-    soft_skills: List[str] = Field(default_factory=list, description="Soft skills")
-    responsibilities: List[str] = Field(default_factory=list, description="Job responsibilities")
-    salary_range: Optional[str] = Field(default=None, description="Salary information")
-    benefits: List[str] = Field(default_factory=list, description="Benefits information")  # Changed to List[str]
-    company_size: Optional[str] = Field(default=None, description="Company size")
-    industry: Optional[str] = Field(default=None, description="Industry")
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, reduce
 
-class JobDescriptionExtractor:
-    def __init__(self, model_name: str = "gemma2:9b-instruct-q4_K_M"):
-        print(f"🚀 Initializing Job Description Extractor with model: {model_name}")
-        
-        self.llm = OllamaLLM(
-            model=model_name,
-            temperature=0.1,
-            num_gpu=40,  # Force GPU usage
-        )
-        
-        self.output_parser = PydanticOutputParser(pydantic_object=JobDescription)
-        
-        self.prompt = ChatPromptTemplate.from_template(
-            """You are an expert job description analyzer. Extract information and respond ONLY with valid JSON. \
+from pydantic import ValidationError
+
+from utilties.job_description_parser.job_description import JobDescription
+from utilties.job_description_parser.job_description_parser import merge_job_descriptions, segment_jd
+from utilties.job_description_parser.json_stream import IncrementalJsonParser, parse_json_object
+from utilties.job_description_parser.llm_backends import get_llm_backend
+from utilties.resume_parser.pdf_text import extract_pdf_text
+
+PROMPT_TEMPLATE = """You are an expert job description analyzer. Extract information and respond ONLY with valid JSON. \
 CRITICAL REQUIREMENTS:
 - You MUST respond with a valid JSON object following the exact schema below
 - Extract ONLY information explicitly mentioned in the job description or resume
@@ -62,70 +39,232 @@ JOB DESCRIPTION TEXT:
 {job_text}
 
 JSON OUTPUT:"""
+
+# Bump when PROMPT_TEMPLATE or the response handling changes, so cached responses are not reused
+EXTRACTOR_VERSION = "2"
+
+LIST_FIELDS = [name for name, field in JobDescription.model_fields.items() if field.default_factory is list]
+
+# Longest JD text sent in one prompt. Together with the instructions and the answer this stays well
+# inside an 8k-token context window; longer JDs are split and extracted chunk by chunk.
+CHUNK_CHARS = 6000
+
+
+def pack_pieces(pieces, max_chars):
+    """
+    Greedily joins consecutive pieces with newlines into chunks of at most max_chars; a piece
+    longer than that is cut into max_chars slices.
+    """
+    chunks, current = [], ""
+    for piece in pieces:
+        for start in range(0, max(len(piece), 1), max_chars):
+            part = piece[start:start + max_chars]
+            if current and len(current) + 1 + len(part) > max_chars:
+                chunks.append(current)
+                current = part
+            else:
+                current = f"{current}\n{part}" if current else part
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def chunk_job_text(text, max_chars=CHUNK_CHARS, heading_lines=()):
+    """
+    Splits a JD into prompt-sized chunks. Cuts fall on section headings where possible and on
+    line breaks otherwise; consecutive short sections share a chunk. A section split across
+    chunks repeats its heading in each, so every chunk says what its lines are.
+    """
+    if len(text) <= max_chars:
+        return [text]
+    lines = text.splitlines()
+    headings = {start for _, start, _ in segment_jd(lines, heading_lines)}
+    starts = sorted(headings | {0})
+
+    pieces = []
+    for start, end in zip(starts, starts[1:] + [len(lines)]):
+        section = "\n".join(lines[start:end])
+        if len(section) <= max_chars:
+            pieces.append(section)
+        elif start in headings:
+            heading = lines[start]
+            pieces.extend(f"{heading}\n{part}" for part in pack_pieces(lines[start + 1:end], max_chars - len(heading) - 1))
+        else:
+            pieces.extend(pack_pieces(lines[start:end], max_chars))
+    return pack_pieces(pieces, max_chars)
+
+
+class JobDescriptionExtractor:
+    """
+    LLM-based JD extraction over a pluggable backend (see llm_backends). Many JDs can be
+    extracted in one call with bounded concurrency, and raw responses are cached by backend,
+    prompt and text hash, so re-running extraction only generates for unseen JDs.
+
+    Responses are streamed and parsed as they arrive; generation stops when the JSON object
+    closes. Backends that support it are constrained to the JobDescription schema.
+
+    JDs longer than max_chunk_chars are split by section, the chunks extracted in parallel and
+    the partial results merged: lists unioned, scalars taken from the first chunk that has them.
+    """
+    def __init__(self, model_name: str = "gemma2:9b-instruct-q4_K_M", backend=None, cache=None, max_concurrency=4,
+                 max_chunk_chars=CHUNK_CHARS):
+        self.backend = backend or get_llm_backend(f"ollama:{model_name}")
+        print(f"🚀 Initializing Job Description Extractor with backend: {self.backend.name}")
+
+        # The template is split once around the JD text; building a prompt is then two concatenations
+        self.prompt_prefix, self.prompt_suffix = PROMPT_TEMPLATE.format(job_text="\0").split("\0")
+        self.cache = cache
+        self.cache_version = "{}:{}:{}".format(
+            EXTRACTOR_VERSION, self.backend.name, hashlib.sha256(PROMPT_TEMPLATE.encode("utf-8")).hexdigest()[:16]
         )
-        
-        self.extraction_chain = (
-            self.prompt
-            | self.llm
-            | self.output_parser
-        )
-        
+        self.max_concurrency = max_concurrency
+        self.max_chunk_chars = max_chunk_chars
+        self.json_schema = JobDescription.model_json_schema() if getattr(self.backend, "supports_json_schema", False) else None
+
         print("✅ Extractor initialized successfully!")
-    
+
+    def build_prompt(self, job_text):
+        return self.prompt_prefix + job_text + self.prompt_suffix
+
     def extract_from_pdf(self, pdf_path: str):
         try:
             print("📄 Loading PDF...")
-            loader = PyMuPDFLoader(file_path=pdf_path)
-            documents = loader.load()
-            
-            job_text = "\n".join([doc.page_content for doc in documents])
+            with open(pdf_path, "rb") as f:
+                pdf_text = extract_pdf_text(f.read())
+            job_text = pdf_text.text
             print(f"📝 Extracted {len(job_text)} characters from PDF")
-            
-            print("🤖 Processing with LLM... (this may take 30-60 seconds)")
-            
-            # FIX: Direct invocation with better error handling
-            raw_response = self.llm.invoke(self.prompt.format(job_text=job_text))
-            
-            print(f"🔍 Raw LLM response: {raw_response[:300]}...")  # Show more of response
-            
-            # FIX: Try to clean the response if it has extra text
-            import json
-            import re
-            
-            # Extract JSON from response (in case there's extra text)
-            json_match = re.search(r'\{.*\}', raw_response, re.DOTALL)
-            if json_match:
-                json_str = json_match.group()
-                print(f"🔧 Extracted JSON: {json_str[:200]}...")
-                
-                # Parse manually first to check
-                try:
-                    parsed_data = json.loads(json_str)
-                    print(f"✅ JSON parsed successfully: {len(parsed_data)} fields")
-                    
-                    # Create JobDescription object manually
-                    result = JobDescription(**parsed_data)
-                    return result
-                    
-                except json.JSONDecodeError as e:
-                    print(f"❌ JSON parsing failed: {e}")
-                    print(f"Raw JSON: {json_str}")
-                    
-            # Fallback: try original parser
-            result = self.output_parser.parse(raw_response)
-            return result
-            
         except Exception as e:
+            print(f"❌ Error while loading PDF: {e}")
+            return self.manual_review_result()
+
+        return self.extract_from_text(job_text, pdf_text.heading_lines)
+
+    def extract_from_text(self, job_text: str, heading_lines=()):
+        print("🤖 Processing with LLM... (this may take 30-60 seconds)")
+        return self.extract_many([job_text], [heading_lines])[0]
+
+    def extract_many(self, job_texts, heading_lines=None):
+        """
+        Extracts every JD in job_texts, returning JobDescriptions in the same order. heading_lines
+        optionally gives, per JD, the line indices styled as headings, to guide chunking.
+        """
+        heading_lines = heading_lines or [()] * len(job_texts)
+        chunked = [chunk_job_text(text, self.max_chunk_chars, headings) for text, headings in zip(job_texts, heading_lines)]
+        partials = iter(self.extract_chunks([chunk for chunks in chunked for chunk in chunks]))
+
+        results = []
+        for chunks in chunked:
+            found = [partial for partial in (next(partials) for _ in chunks) if partial is not None]
+            results.append(reduce(merge_job_descriptions, found) if found else self.manual_review_result())
+        return results
+
+    def extract_chunks(self, job_texts):
+        """
+        One JobDescription (or None when the response was unusable) per text. Cached responses are
+        reused; the rest are streamed from the backend, max_concurrency at a time.
+        """
+        keys = [self.cache_key(text) for text in job_texts]
+        responses = [self.cache.get(key) if self.cache is not None else None for key in keys]
+
+        # Identical JDs in one run are only generated once
+        pending = {}
+        for i, response in enumerate(responses):
+            if response is None:
+                pending.setdefault(keys[i], job_texts[i])
+
+        if pending:
+            start = time.perf_counter()
+            prompts = [self.build_prompt(text) for text in pending.values()]
+            if len(prompts) == 1:
+                generated = [self.generate(prompts[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=max(1, self.max_concurrency)) as pool:
+                    generated = list(pool.map(self.generate, prompts))
+            print(f"🔍 Generated {len(pending)} responses in {time.perf_counter() - start:.1f}s")
+
+            fresh = dict(zip(pending, generated))
+            for key, response in fresh.items():
+                if response is not None and self.cache is not None:
+                    self.cache.put(key, 'llm', self.cache_version, response)
+            responses = [response if response is not None else fresh.get(key) for key, response in zip(keys, responses)]
+
+        return [self.decode_response(response) for response in responses]
+
+    def generate(self, prompt):
+        """
+        Streams one response, feeding it to an incremental JSON parser, and closes the stream as
+        soon as the object is complete. Returns the object's text, or None if nothing came back.
+        """
+        parser = IncrementalJsonParser()
+        stream = self.backend.stream(prompt, json_schema=self.json_schema)
+        try:
+            for chunk in stream:
+                if parser.feed(chunk):
+                    break
+        except Exception as e:
+            # Whatever arrived before the failure is still worth salvaging
             print(f"❌ Error during extraction: {e}")
-            print(f"Full response: {raw_response if 'raw_response' in locals() else 'No response'}")
-            
-            # Return default object with some basic extraction
-            return JobDescription(
-                job_title="Manual Review Required",
-                company_name="Check PDF manually",
-                technical_skills=["Review needed"],
-                responsibilities=["Check original document"]
-            )
+        finally:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+        return parser.raw() if parser.started else None
+
+    def cache_key(self, job_text):
+        if self.cache is None:
+            return hashlib.sha256(job_text.encode("utf-8")).hexdigest()
+        return self.cache.make_key('llm', self.cache_version, content=job_text.encode("utf-8"))
+
+    def parse_response(self, raw_response):
+        result = self.decode_response(raw_response)
+        return result if result is not None else self.manual_review_result()
+
+    def decode_response(self, raw_response):
+        """
+        Builds a JobDescription from every field of the response that decodes and validates; a
+        bad field is dropped on its own instead of discarding the whole response. None when no
+        field survives.
+        """
+        fields = parse_json_object(raw_response) if raw_response is not None else {}
+        fields = {name: value for name, value in fields.items() if name in JobDescription.model_fields}
+        if not fields:
+            print(f"❌ Could not parse LLM response: {(raw_response or '')[:300]}")
+            return None
+
+        # Models often answer a list field with a single string (or null); accept both
+        for name in LIST_FIELDS:
+            if isinstance(fields.get(name), str):
+                fields[name] = [fields[name]]
+            elif name in fields and fields[name] is None:
+                fields[name] = []
+
+        while True:
+            try:
+                return JobDescription(**fields)
+            except ValidationError as e:
+                invalid = {error['loc'][0] for error in e.errors() if error['loc']}
+                print(f"⚠️ Dropping invalid LLM fields: {sorted(invalid)}")
+                if not invalid:
+                    return None
+                for name in invalid:
+                    fields.pop(name, None)
+
+    def manual_review_result(self):
+        return JobDescription(
+            job_title="Manual Review Required",
+            company_name="Check PDF manually",
+            technical_skills=["Review needed"],
+            responsibilities=["Check original document"]
+        )
+
+
+@lru_cache(maxsize=None)
+def get_jd_extractor(backend_spec="ollama", max_concurrency=4, cache=None):
+    """
+    One extractor (and so one backend client) per configuration, shared by every request.
+    """
+    return JobDescriptionExtractor(backend=get_llm_backend(backend_spec), cache=cache, max_concurrency=max_concurrency)
+
 
 def main():
     print("Job Description Extractor")
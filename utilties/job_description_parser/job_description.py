@@ -0,0 +1,18 @@
+from typing import Optional, List
+from pydantic import BaseModel, Field
+
+class JobDescription(BaseModel):
+    job_title: str = Field(default="Not specified", description="The main job title/position")
+    company_name: Optional[str] = Field(default=None, description="Company name")
+    location: Optional[str] = Field(default=None, description="Job location")
+    job_type: Optional[str] = Field(default=None, description="Employment type")
+    experience_required: Optional[str] = Field(default=None, description="Required experience")
+    education_level: Optional[str] = Field(default=None, description="Required education")
+    majors: List[str] = Field(default_factory=list, description="Accepted fields of study")
+    technical_skills: List[str] = Field(default_factory=list, description="Technical skills")
+    soft_skills: List[str] = Field(default_factory=list, description="Soft skills")
+    responsibilities: List[str] = Field(default_factory=list, description="Job responsibilities")
+    salary_range: Optional[str] = Field(default=None, description="Salary information")
+    benefits: List[str] = Field(default_factory=list, description="Benefits information")  # Changed to List[str]
+    company_size: Optional[str] = Field(default=None, description="Company size")
+    industry: Optional[str] = Field(default=None, description="Industry")
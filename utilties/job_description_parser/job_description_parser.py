@@ -1,6 +1,221 @@
+import re
+from functools import lru_cache
+
+from utilties.job_description_parser.job_description import JobDescription
+from utilties.resume_parser.common import SectionSegmenter
+from utilties.resume_parser.education_matcher import get_education_matcher
+from utilties.resume_parser.pdf_text import extract_pdf_text
+from utilties.resume_parser.skill_matcher import KeywordAutomaton, get_skill_matcher
+from utilties.resume_parser.skill_taxonomy import get_skill_taxonomy
+
+# Bump whenever a change to the parser alters its output, so cached parses are not reused
+JD_PARSER_VERSION = "8"
+
+JD_SECTIONS = {
+    'responsibilities': ['responsibilities', 'key responsibilities', 'roles and responsibilities', 'duties',
+                         "what you'll do", 'what you will do', 'the role', 'your role'],
+    'requirements': ['requirements', 'qualifications', 'required skills', 'must have', 'who you are',
+                     "what we're looking for", 'what we are looking for', 'skills'],
+    'benefits': ['benefits', 'perks', 'what we offer', "what's in it for you", 'compensation and benefits'],
+    'about': ['about us', 'about the company', 'company overview', 'who we are'],
+}
+
+SOFT_SKILLS = [
+    'Communication', 'Teamwork', 'Collaboration', 'Leadership', 'Problem Solving', 'Critical Thinking',
+    'Time Management', 'Adaptability', 'Attention to Detail', 'Creativity', 'Mentoring', 'Ownership',
+    'Interpersonal Skills', 'Presentation Skills', 'Stakeholder Management', 'Decision Making',
+    'Self-motivated', 'Analytical Skills', 'Negotiation', 'Conflict Resolution',
+]
+
+SOFT_SKILL_NAMES = {skill.lower() for skill in SOFT_SKILLS}
+
+# Labels may also be written as the JobDescription field names ("experience_required: 3+ years"),
+# which is how the web UI stores a parsed JD file as its description
+LABELLED_FIELD_PATTERN = re.compile(
+    r"^\s*(?P<label>job[\s_]title|position|role|title|company[\s_]name|company|organi[sz]ation|location|"
+    r"job[\s_]location|work[\s_]location|employment[\s_]type|job[\s_]type|salary[\s_]range|salary|compensation|ctc|"
+    r"experience[\s_]required|required[\s_]experience|education[\s_]level|industry|company[\s_]size|team[\s_]size)"
+    r"\s*[:\-–]\s*(?P<value>.+?)\s*$",
+    re.IGNORECASE | re.MULTILINE
+)
+LABEL_FIELDS = {
+    'job title': 'job_title', 'position': 'job_title', 'role': 'job_title', 'title': 'job_title',
+    'company': 'company_name', 'company name': 'company_name', 'organisation': 'company_name',
+    'organization': 'company_name', 'location': 'location', 'job location': 'location',
+    'work location': 'location', 'employment type': 'job_type', 'job type': 'job_type',
+    'salary': 'salary_range', 'salary range': 'salary_range', 'compensation': 'salary_range', 'ctc': 'salary_range',
+    'experience required': 'experience_required', 'required experience': 'experience_required',
+    'education level': 'education_level',
+    'industry': 'industry', 'company size': 'company_size', 'team size': 'company_size',
+}
+# What a stored JD has for a field the parser left empty
+EMPTY_VALUES = {'null', 'none', 'not specified', ''}
+
+JOB_TYPE_PATTERN = re.compile(r"\b(full[\s-]?time|part[\s-]?time|contract(?:ual)?|internship|temporary|freelance)\b", re.IGNORECASE)
+WORK_MODE_PATTERN = re.compile(r"\b(remote|hybrid|on[\s-]?site|work from home)\b", re.IGNORECASE)
+EXPERIENCE_PATTERN = re.compile(
+    r"\b(\d+(?:\.\d+)?\s*\+?\s*(?:(?:-|–|to)\s*\d+\s*\+?\s*)?(?:years?|yrs?))(?=[^.\n]{0,40}\bexperience\b)"
+    r"|\bexperience\b[^.\n]{0,30}?\b(\d+(?:\.\d+)?\s*\+?\s*(?:(?:-|–|to)\s*\d+\s*\+?\s*)?(?:years?|yrs?))",
+    re.IGNORECASE
+)
+SALARY_PATTERN = re.compile(
+    r"(?:[$€£₹]|\b(?:inr|usd|eur|gbp|rs\.?))\s?\d[\d,.]*\s?(?:(?:lpa|lakhs?|k|m|l)\b)?"
+    r"(?:\s*(?:-|–|to)\s*(?:[$€£₹]|\b(?:inr|usd|eur|gbp|rs\.?))?\s?\d[\d,.]*\s?(?:(?:lpa|lakhs?|k|m|l)\b)?)?"
+    r"(?:\s*(?:per|/)\s*(?:year|annum|month|hour|yr|hr))?"
+    r"|\b\d[\d.]*\s*(?:-|–|to)\s*\d[\d.]*\s*(?:lpa|lakhs?(?:\s+per\s+annum)?)\b",
+    re.IGNORECASE
+)
+BULLET_MARKERS = "•·▪◦‣*-–—"
+LEVEL_ORDER = {'bachelor': 1, 'master': 2, 'doctorate': 3}
+
+
+@lru_cache(maxsize=None)
+def get_jd_segmenter():
+    return SectionSegmenter(JD_SECTIONS)
+
+
+@lru_cache(maxsize=None)
+def get_soft_skill_matcher():
+    return KeywordAutomaton(SOFT_SKILLS)
+
+
+def unique(values):
+    return list(dict.fromkeys(values))
+
+
+def unique_ignoring_case(values):
+    # Keeps the first spelling of each value
+    first = {}
+    for value in values:
+        first.setdefault(value.casefold(), value)
+    return list(first.values())
+
+
+def segment_jd(lines, heading_lines=()):
+    """
+    (section, start, end) triples for the JD's lines; see SectionSegmenter.segment.
+    """
+    # JD headings often end with a colon ("Responsibilities:"), which plain headings may not have
+    cleaned = [line.strip().rstrip(':').strip() for line in lines]
+    return get_jd_segmenter().segment(cleaned, heading_lines)
+
+
+def jd_text_from_input(job_description):
+    """
+    Accepts PDF bytes, other bytes (decoded as UTF-8) or str. Returns (text, heading_lines), where
+    heading_lines are the indices of lines the PDF styles as headings.
+    """
+    if isinstance(job_description, (bytes, bytearray, memoryview)):
+        if bytes(job_description[:5]) == b"%PDF-":
+            pdf_text = extract_pdf_text(job_description)
+            return pdf_text.text, pdf_text.heading_lines
+        return bytes(job_description).decode("utf-8", errors="ignore"), set()
+    return job_description or "", set()
+
+
 class JobDescriptionParser:
-    def __init__(self, job_description):
+    """
+    Deterministic JD parser: labelled fields, regexes and the same compiled skill/degree/major
+    matchers the resume side uses. Runs in milliseconds and needs no LLM; see
+    main.get_parsed_jd_data for the optional LLM enrichment on top of it.
+    """
+    def __init__(self, job_description, skills_csv="data/Skills.csv"):
         self.job_description = job_description
+        self.skills_csv = skills_csv
 
     def parse(self):
-        pass
\ No newline at end of file
+        text, heading_lines = jd_text_from_input(self.job_description)
+        lines = text.splitlines()
+        sections = self.segment(lines, heading_lines)
+
+        fields = self.labelled_fields(text)
+        degrees = get_education_matcher().find_degrees(text)
+
+        return JobDescription(
+            job_title=fields.get('job_title') or self.guess_title(lines, sections) or "Not specified",
+            company_name=fields.get('company_name'),
+            location=fields.get('location') or self.first_match(WORK_MODE_PATTERN, text),
+            job_type=fields.get('job_type') or self.first_match(JOB_TYPE_PATTERN, text),
+            experience_required=fields.get('experience_required') or self.experience_required(text),
+            # The lowest degree mentioned is the requirement; higher ones are usually "preferred"
+            education_level=(min(degrees, key=lambda d: LEVEL_ORDER[d.category]).text if degrees
+                             else fields.get('education_level')),
+            majors=unique(match.id for match in get_education_matcher().find_majors(text)),
+            # Skills.csv also lists some soft skills; those are reported under soft_skills only
+            technical_skills=unique(get_skill_taxonomy(self.skills_csv).canonical(match.keyword)
+                                    for match in get_skill_matcher(self.skills_csv).find_all(text)
+                                    if match.keyword.lower() not in SOFT_SKILL_NAMES),
+            soft_skills=unique(match.keyword for match in get_soft_skill_matcher().find_all(text)),
+            responsibilities=self.section_items(lines, sections, 'responsibilities'),
+            salary_range=fields.get('salary_range') or self.first_match(SALARY_PATTERN, text, group=0),
+            benefits=self.section_items(lines, sections, 'benefits'),
+            company_size=fields.get('company_size'),
+            industry=fields.get('industry'),
+        )
+
+    def segment(self, lines, heading_lines):
+        sections = {}
+        for name, start, end in segment_jd(lines, heading_lines):
+            sections.setdefault(name, (start, end))
+        return sections
+
+    def labelled_fields(self, text):
+        fields = {}
+        for match in LABELLED_FIELD_PATTERN.finditer(text):
+            if match.group('value').lower() in EMPTY_VALUES:
+                continue
+            label = re.sub(r"[\s_]+", " ", match.group('label').lower())
+            fields.setdefault(LABEL_FIELDS[label], match.group('value'))
+        return fields
+
+    def guess_title(self, lines, sections):
+        # The first short line before any section heading
+        first_section = min((start for start, _ in sections.values()), default=len(lines))
+        for line in lines[:first_section]:
+            line = line.strip()
+            if line and len(line.split()) <= 8:
+                return line
+        return None
+
+    def first_match(self, pattern, text, group=1):
+        match = pattern.search(text)
+        return match.group(group).strip() if match else None
+
+    def experience_required(self, text):
+        match = EXPERIENCE_PATTERN.search(text)
+        if match is None:
+            return None
+        return re.sub(r"\s+", " ", match.group(1) or match.group(2)).strip()
+
+    def section_items(self, lines, sections, name):
+        if name not in sections:
+            return []
+        start, end = sections[name]
+        body = [line.strip() for line in lines[start + 1:end] if line.strip()]
+
+        # With bullets, an unbulleted line continues the item above it (a wrapped bullet)
+        bulleted = any(line[0] in BULLET_MARKERS for line in body)
+        items = []
+        for line in body:
+            if bulleted and items and line[0] not in BULLET_MARKERS:
+                items[-1] = f"{items[-1]} {line}"
+            else:
+                items.append(line.lstrip(BULLET_MARKERS).strip())
+        return [item for item in items if item]
+
+
+def merge_job_descriptions(primary, secondary):
+    """
+    Fills the fields primary left empty from secondary. List fields are unioned, primary's items
+    first; items differing only in case are kept once.
+    """
+    merged = {}
+    for name, value in primary.model_dump().items():
+        other = getattr(secondary, name, None)
+        if isinstance(value, list):
+            merged[name] = unique_ignoring_case(value + [item for item in other or [] if isinstance(item, str)])
+        elif value in (None, "", "Not specified") and other not in (None, ""):
+            merged[name] = other
+        else:
+            merged[name] = value
+    return JobDescription(**merged)
@@ -0,0 +1,123 @@
+import json
+import re
+
+# Characters that can change the parser state; everything between them is skipped in one step
+STRUCTURAL = re.compile(r'[\\"{}\[\],]')
+STRING_STRUCTURAL = re.compile(r'[\\"]')
+
+
+class IncrementalJsonParser:
+    """
+    Follows the first top-level JSON object in a model's output as it streams in. Text before the
+    object is ignored, every member is decoded as soon as its value is complete, and `done` turns
+    true the moment the object closes, so the caller can stop generation there.
+
+    A malformed member is skipped rather than failing the whole object, and result() salvages the
+    complete members of output that was cut off.
+    """
+    def __init__(self):
+        self.text = ""
+        self.pos = 0
+        self.stack = []
+        self.string_start = None
+        self.member_start = None
+        self.end = None
+        self.fields = {}
+        self.skipped = 0
+
+    @property
+    def started(self):
+        return self.member_start is not None
+
+    @property
+    def done(self):
+        return self.end is not None
+
+    def feed(self, chunk):
+        """
+        Consumes the next piece of output and returns True once the object has closed.
+        """
+        if self.done:
+            return True
+        if not self.started:
+            brace = chunk.find("{")
+            if brace < 0:
+                return False
+            chunk = chunk[brace:]
+        self.text += chunk
+        self.scan()
+        return self.done
+
+    def scan(self):
+        text = self.text
+        while self.pos < len(text):
+            pattern = STRING_STRUCTURAL if self.string_start is not None else STRUCTURAL
+            match = pattern.search(text, self.pos)
+            if match is None:
+                self.pos = len(text)
+                return
+            char, index = match.group(), match.start()
+            # An escape also consumes the next character, which may arrive with the next chunk
+            self.pos = index + 2 if char == "\\" else index + 1
+
+            if self.string_start is not None:
+                if char == '"':
+                    self.string_start = None
+            elif char == '"':
+                self.string_start = index
+            elif char in "{[":
+                self.stack.append(char)
+                if len(self.stack) == 1:
+                    self.member_start = index + 1
+            elif char in "}]":
+                if len(self.stack) == 1:
+                    self.close_member(index)
+                    self.end = index + 1
+                    return
+                if self.stack:
+                    self.stack.pop()
+            elif char == "," and len(self.stack) == 1:
+                self.close_member(index)
+                self.member_start = index + 1
+
+    def close_member(self, end):
+        self.decode_member(self.text[self.member_start:end])
+
+    def decode_member(self, segment):
+        segment = segment.strip()
+        if not segment:
+            return
+        try:
+            self.fields.update(json.loads("{" + segment + "}"))
+        except ValueError:
+            self.skipped += 1
+
+    def raw(self):
+        """
+        The object's text as generated so far; everything after its closing brace is dropped.
+        """
+        return self.text[:self.end]
+
+    def result(self):
+        """
+        The decoded members. If the output stopped inside the object, the member being generated is
+        kept when closing its open brackets makes it valid; a value cut off mid-string is dropped.
+        """
+        if self.started and not self.done:
+            segment = self.text[self.member_start:self.string_start]
+            segment = segment.rstrip().rstrip(",").rstrip()
+            if not segment.endswith(":"):
+                closers = "".join("]" if opener == "[" else "}" for opener in reversed(self.stack[1:]))
+                self.decode_member(segment + closers)
+            # The salvaged member is final; later calls must not decode it again
+            self.end = len(self.text)
+        return self.fields
+
+
+def parse_json_object(text):
+    """
+    Decodes the first JSON object in text with IncrementalJsonParser; see there for the salvaging.
+    """
+    parser = IncrementalJsonParser()
+    parser.feed(text)
+    return parser.result()
@@ -0,0 +1,93 @@
+import json
+import time
+
+DEFAULT_OLLAMA_MODEL = "gemma2:9b-instruct-q4_K_M"
+
+
+class OllamaBackend:
+    """
+    Ollama through langchain. stream() yields tokens as they are generated; closing the stream
+    drops the connection, which stops generation on the server. Ollama constrains decoding to a
+    JSON schema passed as `format`, so the output is always one well-formed object.
+    """
+    supports_json_schema = True
+
+    def __init__(self, model_name=DEFAULT_OLLAMA_MODEL, temperature=0.1, num_gpu=40):
+        from langchain_ollama import OllamaLLM
+        self.name = f"ollama:{model_name}"
+        self.llm = OllamaLLM(
+            model=model_name,
+            temperature=temperature,
+            num_gpu=num_gpu,  # Force GPU usage
+        )
+
+    def invoke(self, prompt, json_schema=None):
+        if json_schema is None:
+            return self.llm.invoke(prompt)
+        return self.llm.invoke(prompt, format=json_schema)
+
+    def stream(self, prompt, json_schema=None):
+        if json_schema is None:
+            return self.llm.stream(prompt)
+        return self.llm.stream(prompt, format=json_schema)
+
+
+class FakeBackend:
+    """
+    Deterministic offline stand-in for an LLM: answers with the JSON the fast JD parser produces
+    for the text embedded in the prompt, streamed in chunks over an optional simulated generation
+    latency, after reading the prompt at `prompt_latency` seconds per 1000 characters. Without a
+    JSON schema it keeps "talking" after the object (`trailing_text`), like an unconstrained model
+    does. Used to test streaming, caching and throughput without a model.
+    """
+    name = "fake"
+    supports_json_schema = True
+
+    def __init__(self, latency=0.0, prompt_latency=0.0, chunk_size=16, trailing_text="",
+                 text_marker="JOB DESCRIPTION TEXT:\n", end_marker="\n\nJSON OUTPUT:"):
+        self.latency = latency
+        self.prompt_latency = prompt_latency
+        self.chunk_size = chunk_size
+        self.trailing_text = trailing_text
+        self.text_marker = text_marker
+        self.end_marker = end_marker
+        self.calls = 0
+        self.chunks = 0
+
+    def respond(self, prompt, json_schema=None):
+        from utilties.job_description_parser.job_description_parser import JobDescriptionParser
+        start = prompt.find(self.text_marker)
+        start = start + len(self.text_marker) if start >= 0 else 0
+        end = prompt.rfind(self.end_marker)
+        job_text = prompt[start:end if end >= start else len(prompt)]
+        response = json.dumps(JobDescriptionParser(job_text).parse().model_dump())
+        return response if json_schema is not None else response + self.trailing_text
+
+    def invoke(self, prompt, json_schema=None):
+        return "".join(self.stream(prompt, json_schema))
+
+    def stream(self, prompt, json_schema=None):
+        self.calls += 1
+        response = self.respond(prompt, json_schema)
+        chunks = [response[i:i + self.chunk_size] for i in range(0, len(response), self.chunk_size)]
+        if self.prompt_latency:
+            time.sleep(self.prompt_latency * len(prompt) / 1000)
+        # The simulated latency is per generated character, so a stream closed early costs less
+        delay = self.latency / len(response) if response else 0.0
+        for chunk in chunks:
+            if delay:
+                time.sleep(delay * len(chunk))
+            self.chunks += 1
+            yield chunk
+
+
+def get_llm_backend(spec="ollama"):
+    """
+    Builds a backend from "ollama[:<model>]" or "fake[:<latency seconds>]".
+    """
+    kind, _, arg = spec.partition(":")
+    if kind == "fake":
+        return FakeBackend(latency=float(arg) if arg else 0.0)
+    if kind == "ollama":
+        return OllamaBackend(arg or DEFAULT_OLLAMA_MODEL)
+    raise ValueError(f"Unknown LLM backend '{spec}'")
@@ -0,0 +1,101 @@
+import os
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_DONE = 'done'
+JOB_FAILED = 'failed'
+
+
+class Job:
+    def __init__(self, job_id):
+        self.job_id = job_id
+        self.status = JOB_QUEUED
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def finished(self):
+        return self.status in (JOB_DONE, JOB_FAILED)
+
+    def to_dict(self):
+        return {
+            'job_id': self.job_id,
+            'status': self.status,
+            'result': self.result,
+            'error': self.error,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at
+        }
+
+
+class JobQueue:
+    """
+    In-process background job runner: submit() returns a job ID straight away and the work runs
+    on a bounded thread pool. Finished jobs are kept (up to max_finished_jobs) so clients can poll.
+    """
+    def __init__(self, max_workers=None, max_finished_jobs=1000):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_finished_jobs = max_finished_jobs
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="job-worker")
+        self._jobs = {}
+        self._changed = threading.Condition()
+
+    def submit(self, fn, *args, **kwargs):
+        job = Job(uuid.uuid4().hex)
+        with self._changed:
+            self._jobs[job.job_id] = job
+            self._prune()
+        self._executor.submit(self._run, job, fn, args, kwargs)
+        return job.job_id
+
+    def _run(self, job, fn, args, kwargs):
+        self._update(job, status=JOB_RUNNING, started_at=time.time())
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            traceback.print_exc()
+            self._update(job, status=JOB_FAILED, error=str(e), finished_at=time.time())
+        else:
+            self._update(job, status=JOB_DONE, result=result, finished_at=time.time())
+
+    def _update(self, job, **fields):
+        with self._changed:
+            for name, value in fields.items():
+                setattr(job, name, value)
+            self._changed.notify_all()
+
+    def _prune(self):
+        finished = [job for job in self._jobs.values() if job.finished]
+        overflow = len(finished) - self.max_finished_jobs
+        if overflow > 0:
+            for job in sorted(finished, key=lambda j: j.finished_at)[:overflow]:
+                del self._jobs[job.job_id]
+
+    def get(self, job_id):
+        with self._changed:
+            job = self._jobs.get(job_id)
+            return job.to_dict() if job else None
+
+    def wait_for_change(self, job_id, last_status, timeout=15):
+        """
+        Blocks until the job leaves last_status (or timeout passes) and returns its current state.
+        """
+        with self._changed:
+            self._changed.wait_for(
+                lambda: job_id not in self._jobs or self._jobs[job_id].status != last_status,
+                timeout=timeout
+            )
+            job = self._jobs.get(job_id)
+            return job.to_dict() if job else None
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,217 @@
+import ast
+import copy
+import re
+import numpy as np
+
+from utilties.resume_parser.education_matcher import get_education_matcher
+from utilties.resume_parser.skill_matcher import get_skill_matcher
+from utilties.resume_parser.skill_taxonomy import get_skill_taxonomy
+
+# Degree levels as ranks; a JD asking for one level above a resume's still gives half credit
+DEGREE_LEVEL_RANKS = {'bachelor': 2, 'master': 3, 'doctorate': 4}
+YEARS_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*\+?\s*(?:-\s*\d+\s*)?(?:years?|yrs?)", re.IGNORECASE)
+MONTHS_PATTERN = re.compile(r"(\d+)\s*months?", re.IGNORECASE)
+
+DEFAULT_WEIGHTS = {'skills': 0.55, 'experience': 0.2, 'education': 0.15, 'majors': 0.1}
+
+
+def normalize_skill(skill):
+    # Aliases and spelling variants ("Nodejs", "Node.Js") share one key
+    return get_skill_taxonomy().key(skill)
+
+
+def parse_list_field(value):
+    """
+    Resume list columns are stored as str(list); anything unparseable counts as empty.
+    """
+    if isinstance(value, (list, tuple, set)):
+        return list(value)
+    try:
+        parsed = ast.literal_eval(value) if value else []
+    except (ValueError, SyntaxError):
+        return []
+    return list(parsed) if isinstance(parsed, (list, tuple, set)) else []
+
+
+def degree_rank(text):
+    # The highest degree mentioned, found with the same patterns the parsers use
+    return max((DEGREE_LEVEL_RANKS[match.category] for match in get_education_matcher().find_degrees(text or "")), default=0)
+
+
+def experience_months(text):
+    """
+    Reads "2 years 3 months" (resume side) or "3+ years" (JD side) as a number of months.
+    """
+    text = text or ""
+    years = YEARS_PATTERN.search(text)
+    months = MONTHS_PATTERN.search(text)
+    total = 0.0
+    if years:
+        total += float(years.group(1)) * 12
+    if months:
+        total += int(months.group(1))
+    return total
+
+
+class JobRequirements:
+    def __init__(self, skills, experience_months=0.0, degree_rank=0, majors=()):
+        self.skills = get_skill_taxonomy().canonical_set(skills)
+        self.experience_months = experience_months
+        self.degree_rank = degree_rank
+        self.majors = [m.strip().lower() for m in majors if m and m.strip()]
+
+    @classmethod
+    def from_job_description(cls, job_description, majors=()):
+        """
+        Builds requirements from anything shaped like JobDescription
+        (technical_skills, experience_required, education_level).
+        """
+        return cls(
+            skills=getattr(job_description, 'technical_skills', None) or [],
+            experience_months=experience_months(getattr(job_description, 'experience_required', None)),
+            degree_rank=degree_rank(getattr(job_description, 'education_level', None)),
+            majors=majors
+        )
+
+    @classmethod
+    def from_text(cls, text, skills_csv="data/Skills.csv"):
+        skills = {match.keyword for match in get_skill_matcher(skills_csv).find_all(text)}
+        return cls(skills=sorted(skills), experience_months=experience_months(text), degree_rank=degree_rank(text))
+
+
+class ResumeMatchIndex:
+    """
+    Column-oriented view of every stored resume, built once and scored with NumPy.
+
+    Skills and majors are kept as CSR-style arrays (indptr/indices over a shared vocabulary), so
+    scoring one JD against all resumes is a gather plus a bincount over the non-zeros. Skill
+    indices are skill taxonomy IDs; skills outside the vocabulary get IDs local to this index.
+    """
+    def __init__(self, rows):
+        self.taxonomy = get_skill_taxonomy()
+        self.local_skill_ids = {}
+        self.major_vocab = {}
+
+        self.resume_ids = np.zeros(0, dtype=np.int64)
+        self.skill_indices = np.zeros(0, dtype=np.int32)
+        self.skill_rows = np.zeros(0, dtype=np.int64)
+        self.major_indices = np.zeros(0, dtype=np.int32)
+        self.major_rows = np.zeros(0, dtype=np.int64)
+        self.experience_months = np.zeros(0, dtype=np.float32)
+        self.degree_ranks = np.zeros(0, dtype=np.int8)
+        self._add_rows(rows)
+
+    def extended(self, rows):
+        """
+        A copy of this index with rows appended. Only the new rows are encoded, and this index is
+        left as it was for requests still scoring against it.
+        """
+        index = copy.copy(self)
+        index.local_skill_ids = dict(self.local_skill_ids)
+        index.major_vocab = dict(self.major_vocab)
+        index._add_rows(rows)
+        return index
+
+    def _add_rows(self, rows):
+        resume_ids = []
+        skill_indices, skill_indptr = [], [0]
+        major_indices, major_indptr = [], [0]
+        months, ranks = [], []
+
+        for row in rows:
+            resume_ids.append(row['resume_id'])
+
+            skill_indices.extend(self.taxonomy.encode(parse_list_field(row['skills']), self.local_skill_ids, add_local=True).tolist())
+            skill_indptr.append(len(skill_indices))
+
+            major_ids = {self.major_vocab.setdefault(m.strip().lower(), len(self.major_vocab))
+                         for m in parse_list_field(row['majors']) if isinstance(m, str) and m.strip()}
+            major_indices.extend(sorted(major_ids))
+            major_indptr.append(len(major_indices))
+
+            months.append(experience_months(row['total_experience']))
+            ranks.append(max((degree_rank(d) for d in parse_list_field(row['degrees']) if isinstance(d, str)), default=0))
+
+        # New rows are numbered after the ones already held; every array is replaced, never written to
+        new_rows = np.arange(len(self.resume_ids), len(self.resume_ids) + len(resume_ids))
+        self.resume_ids = np.concatenate([self.resume_ids, np.asarray(resume_ids, dtype=np.int64)])
+        self.skill_indices = np.concatenate([self.skill_indices, np.asarray(skill_indices, dtype=np.int32)])
+        self.skill_rows = np.concatenate([self.skill_rows, np.repeat(new_rows, np.diff(skill_indptr))])
+        self.major_indices = np.concatenate([self.major_indices, np.asarray(major_indices, dtype=np.int32)])
+        self.major_rows = np.concatenate([self.major_rows, np.repeat(new_rows, np.diff(major_indptr))])
+        self.experience_months = np.concatenate([self.experience_months, np.asarray(months, dtype=np.float32)])
+        self.degree_ranks = np.concatenate([self.degree_ranks, np.asarray(ranks, dtype=np.int8)])
+
+        # Rare skills say more about a candidate than ubiquitous ones. A vocabulary skill no resume
+        # has gets the highest weight, which is also what a JD skill unknown to the index counts with.
+        doc_freq = np.bincount(self.skill_indices, minlength=self.taxonomy.vocabulary_size + len(self.local_skill_ids))
+        self.skill_idf = (np.log((len(self.resume_ids) + 1) / (doc_freq + 1)) + 1).astype(np.float32)
+
+    def __len__(self):
+        return len(self.resume_ids)
+
+    def score(self, requirements, weights=DEFAULT_WEIGHTS):
+        """
+        Returns (total, components) where every array holds one score in [0, 1] per resume.
+        A criterion the JD does not specify gives every resume full credit.
+        """
+        n = len(self.resume_ids)
+        components = {}
+
+        if requirements.skills:
+            # Skills no resume has still count towards the total a perfect candidate would cover
+            jd_skill_ids = self.taxonomy.encode(requirements.skills, self.local_skill_ids)
+            unseen = len(requirements.skills) - len(jd_skill_ids)
+            skill_weights = np.zeros(len(self.skill_idf), dtype=np.float32)
+            skill_weights[jd_skill_ids] = self.skill_idf[jd_skill_ids]
+            denominator = skill_weights.sum() + unseen * float(self.skill_idf.max(initial=1.0))
+            matched = np.bincount(self.skill_rows, weights=skill_weights[self.skill_indices], minlength=n)
+            components['skills'] = (matched / denominator).astype(np.float32)
+        else:
+            components['skills'] = np.ones(n, dtype=np.float32)
+
+        if requirements.experience_months > 0:
+            components['experience'] = np.minimum(self.experience_months / requirements.experience_months, 1.0)
+        else:
+            components['experience'] = np.ones(n, dtype=np.float32)
+
+        if requirements.degree_rank > 0:
+            gap = requirements.degree_rank - self.degree_ranks.astype(np.int16)
+            components['education'] = np.select([gap <= 0, gap == 1], [1.0, 0.5], 0.0).astype(np.float32)
+        else:
+            components['education'] = np.ones(n, dtype=np.float32)
+
+        jd_major_ids = [self.major_vocab[m] for m in requirements.majors if m in self.major_vocab]
+        if requirements.majors:
+            major_hits = np.isin(self.major_indices, jd_major_ids)
+            components['majors'] = (np.bincount(self.major_rows, weights=major_hits, minlength=n) > 0).astype(np.float32)
+        else:
+            components['majors'] = np.ones(n, dtype=np.float32)
+
+        total = sum(weights[name] * components[name] for name in weights)
+        return total, components
+
+    def rank(self, requirements, top_k=10, candidate_ids=None, weights=DEFAULT_WEIGHTS):
+        """
+        Returns the top_k resumes for a JD, best first. candidate_ids restricts ranking to a
+        prefiltered subset of resume IDs.
+        """
+        if len(self.resume_ids) == 0 or top_k < 1:
+            return []
+
+        total, components = self.score(requirements, weights)
+        if candidate_ids is not None:
+            total = np.where(np.isin(self.resume_ids, np.asarray(list(candidate_ids), dtype=np.int64)), total, -np.inf)
+
+        k = min(top_k, len(total))
+        top = np.argpartition(-total, k - 1)[:k]
+        top = top[np.argsort(-total[top], kind='stable')]
+
+        return [
+            {
+                'resume_id': int(self.resume_ids[i]),
+                'score': round(float(total[i]), 4),
+                **{name: round(float(values[i]), 4) for name, values in components.items()}
+            }
+            for i in top if np.isfinite(total[i])
+        ]
@@ -0,0 +1,263 @@
+import glob
+import json
+import os
+import time
+import zlib
+import numpy as np
+
+from utilties.matching.match_engine import parse_list_field
+
+
+def normalize_rows(vectors):
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+class HashingEmbedder:
+    """
+    Character n-gram hashing embedder. Needs no model at all, so it always works offline,
+    but it only captures spelling similarity ("Node.js" ~ "NodeJS"), not meaning.
+    """
+    name = "hashing"
+
+    def __init__(self, dim=256, ngram_range=(3, 5)):
+        self.dim = dim
+        self.ngram_range = ngram_range
+
+    def embed(self, texts):
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            padded = f" {text.lower()} "
+            for n in range(self.ngram_range[0], self.ngram_range[1] + 1):
+                for i in range(len(padded) - n + 1):
+                    # crc32 is stable across processes, unlike hash()
+                    bucket = zlib.crc32(padded[i:i + n].encode("utf-8"))
+                    vectors[row, bucket % self.dim] += 1.0 if bucket & 0x80000000 else -1.0
+        return normalize_rows(vectors)
+
+
+class SpacyVectorEmbedder:
+    """
+    Static word vectors from a spaCy package that ships them (en_core_web_md / en_core_web_lg).
+    """
+    def __init__(self, model_name="en_core_web_md"):
+        import spacy
+        self.name = f"spacy:{model_name}"
+        # Only the vectors are needed, so no pipeline component has to run
+        self.nlp = spacy.load(model_name, exclude=["tagger", "parser", "ner", "lemmatizer", "attribute_ruler", "senter"])
+        self.dim = self.nlp.vocab.vectors_length
+
+    def embed(self, texts):
+        docs = self.nlp.pipe(texts, batch_size=256)
+        return normalize_rows([doc.vector for doc in docs])
+
+
+class SentenceTransformerEmbedder:
+    """
+    Small CPU sentence-embedding model (sentence-transformers, optional dependency).
+    """
+    def __init__(self, model_name="all-MiniLM-L6-v2"):
+        from sentence_transformers import SentenceTransformer
+        self.name = f"sentence-transformers:{model_name}"
+        self.model = SentenceTransformer(model_name, device="cpu")
+        self.dim = self.model.get_sentence_embedding_dimension()
+
+    def embed(self, texts):
+        return normalize_rows(self.model.encode(list(texts), batch_size=64, convert_to_numpy=True))
+
+
+DEFAULT_EMBEDDER = "spacy:en_core_web_md"
+
+
+def get_embedder(spec=None):
+    """
+    Builds an embedder from "hashing", "spacy:<package>" or "sentence-transformers:<model>".
+
+    A backend that was asked for must load, since hashing only compares spellings and would
+    quietly turn "semantic" scores into n-gram overlap. Only when no backend was given does a
+    missing DEFAULT_EMBEDDER model fall back to hashing.
+    """
+    if spec is None:
+        try:
+            return get_embedder(DEFAULT_EMBEDDER)
+        except Exception as e:
+            print(f"[WARNING] Could not load the default embedder '{DEFAULT_EMBEDDER}', using hashing instead: {e}")
+            return HashingEmbedder()
+
+    kind, _, model_name = spec.partition(":")
+    if kind == "hashing":
+        return HashingEmbedder()
+    if kind == "spacy":
+        return SpacyVectorEmbedder(model_name or "en_core_web_md")
+    if kind == "sentence-transformers":
+        return SentenceTransformerEmbedder(model_name or "all-MiniLM-L6-v2")
+    raise ValueError(f"Unknown embedding backend '{spec}'")
+
+
+def mean_vector(vectors):
+    if len(vectors) == 0:
+        return None
+    return normalize_rows(vectors.mean(axis=0))
+
+
+class InvertedFileIndex:
+    """
+    Approximate cosine search: vectors are bucketed under their nearest of ~sqrt(n) k-means centroids,
+    and a query only scans the n_probe buckets whose centroids are closest to it.
+    """
+    def __init__(self, vectors, n_lists=None, n_probe=16, n_iter=10, sample_size=20000, seed=0):
+        self.vectors = vectors
+        self.n_probe = n_probe
+        n = len(vectors)
+        n_lists = min(n_lists or max(int(np.sqrt(n)), 1), n)
+        rng = np.random.default_rng(seed)
+
+        # Spherical k-means on a sample is enough to place the centroids
+        sample = vectors[rng.choice(n, size=min(sample_size, n), replace=False)]
+        centroids = sample[rng.choice(len(sample), size=n_lists, replace=False)]
+        for _ in range(n_iter):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample)
+            empty = np.bincount(assignment, minlength=n_lists) == 0
+            sums[empty] = centroids[empty]
+            centroids = normalize_rows(sums)
+        self.centroids = centroids
+
+        assignment = np.concatenate([
+            np.argmax(vectors[i:i + 50000] @ centroids.T, axis=1) for i in range(0, n, 50000)
+        ])
+        self.order = np.argsort(assignment, kind="stable")
+        self.offsets = np.concatenate(([0], np.cumsum(np.bincount(assignment, minlength=n_lists))))
+
+    def search(self, query, k=10):
+        probe = np.argsort(-(self.centroids @ query))[:self.n_probe]
+        candidates = np.concatenate([self.order[self.offsets[c]:self.offsets[c + 1]] for c in probe])
+        if len(candidates) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        scores = self.vectors[candidates] @ query
+        top = np.argsort(-scores)[:k]
+        return candidates[top], scores[top]
+
+
+class VectorIndex:
+    """
+    Unit-length float32 vectors in a memory-mapped .npy file, with their keys in a .json manifest next to it.
+    Search is exact (brute-force matrix product) unless an approximate index has been built.
+
+    Every build writes a new .npy and then atomically replaces the manifest that names it, so a
+    process still mapping the previous vectors never sees a file change under it.
+    """
+    def __init__(self, keys, vectors, embedder_name=None):
+        self.keys = list(keys)
+        self.vectors = vectors
+        self.embedder_name = embedder_name
+        self.approximate = None
+
+    @classmethod
+    def build(cls, path, keys, vectors, embedder_name=None):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        vectors = normalize_rows(vectors)
+        vectors_file = f"{os.path.basename(path)}.{time.time_ns():x}.npy"
+        stored = np.lib.format.open_memmap(os.path.join(os.path.dirname(path), vectors_file), mode="w+",
+                                           dtype=np.float32, shape=vectors.shape)
+        stored[:] = vectors
+        stored.flush()
+        del stored
+
+        with open(path + ".json.tmp", "w", encoding="utf-8") as f:
+            json.dump({"keys": list(keys), "embedder": embedder_name, "vectors": vectors_file}, f)
+        os.replace(path + ".json.tmp", path + ".json")
+
+        # Earlier builds' vectors; a file another process still maps (Windows) is left for the next build
+        for stale in glob.glob(glob.escape(path) + ".*.npy") + [path + ".npy"]:
+            if os.path.basename(stale) != vectors_file and os.path.exists(stale):
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+        return cls.load(path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path + ".json", encoding="utf-8") as f:
+            meta = json.load(f)
+        # Manifests written before versioned vector files name no file
+        vectors_path = os.path.join(os.path.dirname(path), meta["vectors"]) if "vectors" in meta else path + ".npy"
+        vectors = np.load(vectors_path, mmap_mode="r")
+        return cls(meta["keys"], vectors, meta.get("embedder"))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def build_approximate(self, n_lists=None, n_probe=16):
+        if len(self.keys):
+            self.approximate = InvertedFileIndex(np.asarray(self.vectors), n_lists=n_lists, n_probe=n_probe)
+        return self
+
+    def search(self, query, k=10, exact=None):
+        """
+        Returns [(key, cosine similarity)] for the k nearest vectors to a unit-length query.
+        """
+        if len(self.keys) == 0 or k < 1:
+            return []
+        query = np.asarray(query, dtype=np.float32)
+        rows = None
+        if self.approximate is not None and not exact:
+            rows, scores = self.approximate.search(query, k)
+            # Probed buckets held fewer than k vectors: fall back to the exact scan rather than return a short list
+            if len(rows) < min(k, len(self.keys)):
+                rows = None
+        if rows is None:
+            all_scores = self.vectors @ query
+            k = min(k, len(all_scores))
+            rows = np.argpartition(-all_scores, k - 1)[:k]
+            rows = rows[np.argsort(-all_scores[rows])]
+            scores = all_scores[rows]
+        return [(self.keys[row], float(score)) for row, score in zip(rows, scores)]
+
+
+class SemanticSkillMatcher:
+    """
+    Embedding-based skill matching: nearest canonical skills for a term, and a soft coverage score
+    between a JD's skill list and a resume's skill list.
+    """
+    def __init__(self, embedder, skill_index=None):
+        self.embedder = embedder
+        self.skill_index = skill_index
+
+    def related_skills(self, skill, k=5):
+        return self.skill_index.search(self.embedder.embed([skill])[0], k)
+
+    def skill_list_vector(self, skills):
+        skills = [s for s in skills if isinstance(s, str) and s.strip()]
+        return mean_vector(self.embedder.embed(skills)) if skills else None
+
+    def coverage(self, jd_skills, resume_skills):
+        """
+        For each JD skill, the similarity of the closest resume skill, averaged over the JD skills.
+        """
+        if not jd_skills or not resume_skills:
+            return 0.0
+        similarity = self.embedder.embed(list(jd_skills)) @ self.embedder.embed(list(resume_skills)).T
+        return float(similarity.max(axis=1).clip(min=0).mean())
+
+
+def build_skill_vector_index(path, embedder, vocabulary):
+    return VectorIndex.build(path, vocabulary, embedder.embed(vocabulary), embedder.name)
+
+
+def build_resume_vector_index(path, embedder, rows):
+    """
+    One vector per resume: the mean of its skill embeddings. Resumes without skills are skipped.
+    """
+    matcher = SemanticSkillMatcher(embedder)
+    keys, vectors = [], []
+    for row in rows:
+        vector = matcher.skill_list_vector(parse_list_field(row['skills']))
+        if vector is not None:
+            keys.append(row['resume_id'])
+            vectors.append(vector)
+    vectors = np.vstack(vectors) if vectors else np.zeros((0, embedder.dim), dtype=np.float32)
+    return VectorIndex.build(path, keys, vectors, embedder.name)
@@ -0,0 +1,136 @@
+import numpy as np
+
+from utilties.matching.match_engine import normalize_skill, parse_list_field
+
+SKILL_INDEX_SCHEMA = [
+    '''
+    CREATE TABLE IF NOT EXISTS skills (
+        skill_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL UNIQUE
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS resume_skills (
+        skill_id INTEGER NOT NULL,
+        resume_id INTEGER NOT NULL,
+        PRIMARY KEY (skill_id, resume_id),
+        FOREIGN KEY(skill_id) REFERENCES skills(skill_id),
+        FOREIGN KEY(resume_id) REFERENCES resumes(resume_id)
+    ) WITHOUT ROWID
+    ''',
+    # The primary key already serves skill -> resumes lookups; this one serves resume -> skills
+    'CREATE INDEX IF NOT EXISTS idx_resume_skills_resume ON resume_skills(resume_id)',
+]
+
+
+def create_skill_index_tables(conn):
+    for statement in SKILL_INDEX_SCHEMA:
+        conn.execute(statement)
+
+
+def skill_ids_for(conn, skills, create=True):
+    """
+    Maps skill names to their canonical IDs, registering unseen names when create is True.
+    """
+    names = sorted({normalize_skill(s) for s in skills if isinstance(s, str) and s.strip()})
+    if not names:
+        return {}
+    if create:
+        conn.executemany('INSERT OR IGNORE INTO skills (name) VALUES (?)', [(name,) for name in names])
+    placeholders = ','.join('?' * len(names))
+    rows = conn.execute(f'SELECT name, skill_id FROM skills WHERE name IN ({placeholders})', names).fetchall()
+    return {row[0]: row[1] for row in rows}
+
+
+def store_resume_skills(conn, resume_skills):
+    """
+    Writes postings for [(resume_id, skills), ...]. The caller owns the transaction.
+    """
+    all_skills = [s for _, skills in resume_skills for s in skills if isinstance(s, str)]
+    ids = skill_ids_for(conn, all_skills)
+    conn.executemany(
+        'INSERT OR IGNORE INTO resume_skills (skill_id, resume_id) VALUES (?, ?)',
+        [(ids[normalize_skill(s)], resume_id)
+         for resume_id, skills in resume_skills
+         for s in skills if isinstance(s, str) and s.strip()]
+    )
+
+
+def backfill_resume_skills(conn, batch_size=1000):
+    """
+    Indexes resumes stored before the resume_skills table existed. Returns how many were indexed.
+    """
+    rows = conn.execute('''
+        SELECT resume_id, skills FROM resumes
+        WHERE resume_id NOT IN (SELECT DISTINCT resume_id FROM resume_skills)
+    ''').fetchall()
+    for start in range(0, len(rows), batch_size):
+        with conn:
+            store_resume_skills(conn, [(row[0], parse_list_field(row[1])) for row in rows[start:start + batch_size]])
+    return len(rows)
+
+
+def rebuild_resume_skills(conn, batch_size=1000):
+    """
+    Drops every posting and skill name and indexes all resumes again, e.g. after the skill
+    normalisation changed. Returns how many resumes were indexed.
+    """
+    with conn:
+        conn.execute('DELETE FROM resume_skills')
+        conn.execute('DELETE FROM skills')
+    return backfill_resume_skills(conn, batch_size)
+
+
+class SkillPostingsIndex:
+    """
+    In-memory postings lists (skill -> sorted resume IDs) loaded from resume_skills, used to
+    answer boolean skill queries before any scoring runs.
+    """
+    def __init__(self, conn):
+        self.skill_ids = {row[0]: row[1] for row in conn.execute('SELECT name, skill_id FROM skills')}
+        pairs = np.asarray(
+            conn.execute('SELECT skill_id, resume_id FROM resume_skills ORDER BY skill_id, resume_id').fetchall(),
+            dtype=np.int64
+        ).reshape(-1, 2)
+
+        # One contiguous array of resume IDs, sliced per skill
+        self.resume_ids = pairs[:, 1].copy()
+        skill_column = pairs[:, 0]
+        boundaries = np.flatnonzero(np.diff(skill_column)) + 1
+        starts = np.concatenate(([0], boundaries)) if len(skill_column) else np.empty(0, dtype=np.int64)
+        ends = np.concatenate((boundaries, [len(skill_column)])) if len(skill_column) else np.empty(0, dtype=np.int64)
+        self._ranges = {int(skill_column[s]): (int(s), int(e)) for s, e in zip(starts, ends)}
+        # Every stored resume, including those with no indexed skills: they have "none of" any skill
+        self.all_resume_ids = np.asarray(
+            [row[0] for row in conn.execute('SELECT resume_id FROM resumes ORDER BY resume_id')], dtype=np.int64
+        )
+
+    def postings(self, skill):
+        skill_id = self.skill_ids.get(normalize_skill(skill))
+        if skill_id is None or skill_id not in self._ranges:
+            return np.empty(0, dtype=np.int64)
+        start, end = self._ranges[skill_id]
+        return self.resume_ids[start:end]
+
+    def query(self, all_of=(), any_of=(), none_of=()):
+        """
+        Returns the sorted resume IDs that have every skill in all_of, at least one of any_of
+        (when given) and none of none_of.
+        """
+        result = None
+        # Intersect shortest lists first so the working set shrinks as fast as possible
+        for postings in sorted((self.postings(s) for s in all_of), key=len):
+            result = postings if result is None else np.intersect1d(result, postings, assume_unique=True)
+            if len(result) == 0:
+                return result
+
+        if any_of:
+            union = np.unique(np.concatenate([self.postings(s) for s in any_of]))
+            result = union if result is None else np.intersect1d(result, union, assume_unique=True)
+
+        if result is None:
+            result = self.all_resume_ids
+
+        for skill in none_of:
+            result = np.setdiff1d(result, self.postings(skill), assume_unique=True)
+        return result
@@ -0,0 +1,106 @@
+import json
+import threading
+import time
+
+from utilties.storage import connect, content_digest
+
+
+class ParseCache:
+    """
+    Content-addressed cache of parser output, stored in a SQLite table.
+
+    Entries are keyed by the SHA-256 of the uploaded bytes plus the kind of document and the
+    parser version, so bumping a parser version makes every older entry unreachable.
+    The table is bounded to max_entries, evicting the least recently used rows.
+    """
+    def __init__(self, db_path, max_entries=1000):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = connect(db_path, check_same_thread=False)
+
+        with self._lock:
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS parse_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    parser_version TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            ''')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS idx_parse_cache_last_access ON parse_cache(last_access)')
+            self._conn.commit()
+
+    def make_key(self, kind, parser_version, content=None, digest=None):
+        if digest is None:
+            digest = content_digest(content)
+        return f"{kind}:{parser_version}:{digest}"
+
+    def get(self, key):
+        with self._lock:
+            row = self._conn.execute('SELECT payload FROM parse_cache WHERE cache_key = ?', (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute('UPDATE parse_cache SET last_access = ? WHERE cache_key = ?', (time.time(), key))
+            self._conn.commit()
+        return json.loads(row[0])
+
+    def put(self, key, kind, parser_version, value):
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO parse_cache (cache_key, kind, parser_version, payload, last_access) VALUES (?, ?, ?, ?, ?)',
+                (key, kind, parser_version, json.dumps(value), time.time())
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        count = self._conn.execute('SELECT COUNT(*) FROM parse_cache').fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                'DELETE FROM parse_cache WHERE cache_key IN (SELECT cache_key FROM parse_cache ORDER BY last_access ASC LIMIT ?)',
+                (overflow,)
+            )
+
+    def get_or_compute(self, kind, parser_version, content, compute, digest=None):
+        """
+        Returns the cached result for these bytes, or runs compute() and stores what it returns.
+        """
+        key = self.make_key(kind, parser_version, content=content, digest=digest)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        value = compute()
+        self.put(key, kind, parser_version, value)
+        return value
+
+    def invalidate_other_versions(self, kind, parser_version):
+        """
+        Deletes entries written by any other version of a parser.
+        """
+        with self._lock:
+            self._conn.execute('DELETE FROM parse_cache WHERE kind = ? AND parser_version != ?', (kind, parser_version))
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute('DELETE FROM parse_cache')
+            self._conn.commit()
+
+    def stats(self):
+        with self._lock:
+            entries = self._conn.execute('SELECT COUNT(*) FROM parse_cache').fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'entries': entries,
+            'max_entries': self.max_entries
+        }
@@ -1,26 +1,91 @@
 import re
 
-def is_likely_section_heading(line, keywords):
+HEADING_PUNCTUATION = (":", ".", "-", "•", "(", ")")
+
+# Section name -> headings that open it. Every extractor segments the resume with this one table.
+RESUME_SECTIONS = {
+    'education': ['education', 'academics', 'qualification', 'educational background', 'academic background'],
+    'experience': ['experience', 'employment', 'work history', 'professional background', 'work experience', 'career history',
+                   'career summary', 'job history', 'employment history', 'professional experience', 'job experience', 'work summary',
+                   'career experience', 'career details', 'job details', 'job summary', 'employment details', 'work details',
+                   'career overview', 'job overview', 'employment overview'],
+    'skills': ['skills', 'technical skills', 'technical expertise and skills'],
+    'projects': ['projects', 'academic projects'],
+    'certifications': ['certifications', 'courses', 'training', 'seminars', 'conferences', 'workshops'],
+    'summary': ['summary', 'objective', 'profile', 'about me'],
+    'contact': ['contact'],
+    'awards': ['awards', 'achievements'],
+    'publications': ['publications', 'patents', 'research'],
+    'activities': ['extracurricular', 'activities', 'interests', 'hobbies'],
+    'affiliations': ['professional affiliations', 'associations'],
+    'languages': ['languages'],
+    'references': ['references'],
+}
+
+
+def looks_like_heading(line_clean):
     """
-    Checks if a line is likely a section heading based on formatting and keywords.
+    Formatting constraints shared by every heading: short, no punctuation, capitalised.
     """
-    line_clean = line.strip()
-    if not line_clean:
-        return False
-
-    # Check constraints
     is_short = len(line_clean.split()) <= 5
-    no_punct = not any(c in line_clean for c in [":", ".", "-", "•", "(", ")"])
-    # has_keyword = any(kw.lower() in line_clean.lower() for kw in keywords)
-    has_keyword = any(
-        re.match(rf'^(?i){kw}\b$', line_clean) or             # line is exactly keyword
-        re.match(rf'^(?i){kw}\b[\s\S]*$', line_clean)         # line starts with keyword
-        for kw in keywords
-                        )
+    no_punct = not any(c in line_clean for c in HEADING_PUNCTUATION)
     is_formatted = (
         line_clean.isupper() or
         line_clean.istitle() or
         line_clean[0].isupper()
     )
+    return is_short and no_punct and is_formatted
+
+
+def compile_keyword_alternation(keywords):
+    # Longest keywords first so "work experience" wins over "work" style prefixes
+    unique = sorted({kw.strip().lower() for kw in keywords if kw.strip()}, key=len, reverse=True)
+    return re.compile(r'^(?:' + '|'.join(re.escape(kw) for kw in unique) + r')\b', re.IGNORECASE)
+
+
+class SectionSegmenter:
+    """
+    Labels every line of a resume with the section heading it opens, in one pass.
+    """
+    def __init__(self, sections=RESUME_SECTIONS):
+        self.keyword_to_section = {}
+        for section, keywords in sections.items():
+            for kw in keywords:
+                self.keyword_to_section.setdefault(kw.strip().lower(), section)
+        self.pattern = compile_keyword_alternation(self.keyword_to_section)
+
+    def label_line(self, line, styled=False):
+        """
+        styled marks a line the PDF sets like a heading (larger or bold font); such lines only
+        need to be short, so "SKILLS & TOOLS" or "Experience:" still count.
+        """
+        line_clean = line.strip()
+        if not line_clean:
+            return None
+        match = self.pattern.match(line_clean)
+        if match is None:
+            return None
+        if not (looks_like_heading(line_clean) or (styled and len(line_clean.split()) <= 5)):
+            return None
+        return self.keyword_to_section[match.group(0).lower()]
+
+    def label_lines(self, lines, heading_hints=()):
+        """
+        Returns one entry per line: the section name when the line is a heading, otherwise None.
+        heading_hints is a set of line indices styled as headings in the source document.
+        """
+        return [self.label_line(line, i in heading_hints) for i, line in enumerate(lines)]
 
-    return is_short and no_punct and has_keyword and is_formatted
\ No newline at end of file
+    def segment(self, lines, heading_hints=()):
+        """
+        Returns (section, start, end) triples, where lines[start] is the heading and end is exclusive.
+        A section runs until the next heading of a different section.
+        """
+        segments = []
+        for i, label in enumerate(self.label_lines(lines, heading_hints)):
+            if label is None or (segments and segments[-1][0] == label):
+                continue
+            if segments:
+                segments[-1][2] = i
+            segments.append([label, i, len(lines)])
+        return [tuple(segment) for segment in segments]
@@ -0,0 +1,130 @@
+import re
+from collections import namedtuple
+from datetime import date
+
+# start and end are month indices (year * 12 + month - 1); both ends are inclusive
+DateInterval = namedtuple("DateInterval", ["start", "end", "span_start", "span_end", "text"])
+
+MONTHS = {
+    "jan": 1, "january": 1, "feb": 2, "february": 2, "mar": 3, "march": 3, "apr": 4, "april": 4,
+    "may": 5, "jun": 6, "june": 6, "jul": 7, "july": 7, "aug": 8, "august": 8,
+    "sep": 9, "sept": 9, "september": 9, "oct": 10, "october": 10, "nov": 11, "november": 11,
+    "dec": 12, "december": 12,
+}
+
+# One scanner for the date and open-end tokens a range is made of. Alternatives are tried in order
+# at each position, so "2020-01" is read as a year-month before "2020" alone. Every token starts at a
+# word boundary with one of a few characters; the lookahead lets the engine reject all other
+# positions at once, and the month names are written as a prefix tree to avoid backtracking.
+TOKEN_PATTERN = re.compile(
+    r"\b(?=[adfjmnopstc0-9])(?:"
+    r"(?P<month_name>(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?"
+    r"|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\b)\.?,?\s*'?(?P<month_name_year>\d{4}|\d{2})\b"
+    r"|(?P<numeric_month>\d{1,2})[/.](?P<numeric_year>\d{4})\b"
+    r"|(?P<iso_year>(?:19|20)\d{2})-(?P<iso_month>\d{2})\b"
+    r"|(?P<year>(?:19|20)\d{2})\b"
+    r"|(?P<open_end>(?:present|current(?:ly)?|now|ongoing|till\s+date|to\s+date)\b))",
+    re.IGNORECASE
+)
+
+# What may sit between the start and end of one range, once GAP_CHARACTERS are stripped
+SEPARATORS = {"", "-", "–", "—", "to", "till", "until"}
+GAP_CHARACTERS = " \t\n,()[]|:"
+
+
+def month_index(year, month):
+    return year * 12 + month - 1
+
+
+def expand_year(digits, today):
+    if len(digits) == 4:
+        return int(digits)
+    # Two-digit years up to next year are this century, the rest the previous one
+    year = 2000 + int(digits)
+    return year if year <= today.year + 1 else year - 100
+
+
+def read_date(match, today):
+    """
+    Returns the month index of a date token, or None when it is not a valid date.
+    """
+    kind = match.lastgroup
+    if kind == "month_name_year":
+        year, month = expand_year(match.group("month_name_year"), today), MONTHS[match.group("month_name").lower()]
+    elif kind == "numeric_year":
+        year, month = int(match.group("numeric_year")), int(match.group("numeric_month"))
+    elif kind == "iso_month":
+        year, month = int(match.group("iso_year")), int(match.group("iso_month"))
+    elif kind == "year":
+        year, month = int(match.group("year")), 1
+    else:
+        return None
+    return month_index(year, month) if 1 <= month <= 12 else None
+
+
+def find_date_ranges(text, today=None):
+    """
+    Scans text once and returns every "<date> <separator> <date | present>" range as a DateInterval,
+    in text order. Ranges that end before they start, or start in the future, are dropped.
+    """
+    today = today or date.today()
+    now = month_index(today.year, today.month)
+    intervals = []
+
+    # The start of a range waiting for its end: the next token, if only a separator lies between them
+    start, start_match = None, None
+
+    for match in TOKEN_PATTERN.finditer(text):
+        kind = match.lastgroup
+
+        gap = text[start_match.end():match.start()].strip(GAP_CHARACTERS).lower() if start is not None else None
+        # Two bare dates need a separator between them; "Jan 2018 (Present)" does not
+        if gap in SEPARATORS and (gap or kind == "open_end"):
+            end = now if kind == "open_end" else read_date(match, today)
+            if end is not None:
+                if start <= end and start <= now:
+                    intervals.append(DateInterval(start, end, start_match.start(), match.end(),
+                                                  text[start_match.start():match.end()]))
+                start, start_match = None, None
+                continue
+
+        # Otherwise this token may begin a new range
+        start = read_date(match, today)
+        start_match = match if start is not None else None
+
+    return intervals
+
+
+def merge_intervals(intervals):
+    """
+    Unions overlapping or touching intervals so months covered by two jobs are counted once.
+    Returns sorted (start, end) month index pairs.
+    """
+    merged = []
+    for start, end in sorted((interval.start, interval.end) for interval in intervals):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [tuple(pair) for pair in merged]
+
+
+def format_month_index(index):
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+def summarize_experience(text, today=None):
+    """
+    Returns {'intervals': [...], 'total_months': int} for the ranges found in text, where every
+    interval is {'start': 'YYYY-MM', 'end': 'YYYY-MM', 'text': ...} and total_months counts each
+    calendar month at most once.
+    """
+    intervals = find_date_ranges(text, today)
+    total_months = sum(end - start + 1 for start, end in merge_intervals(intervals))
+    return {
+        'intervals': [
+            {'start': format_month_index(i.start), 'end': format_month_index(i.end), 'text': i.text}
+            for i in intervals
+        ],
+        'total_months': total_months,
+    }
@@ -0,0 +1,82 @@
+import csv
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+from utilties.resume_parser.skill_matcher import KeywordAutomaton
+
+# kind is "degree" or "major"; id is the normalized degree ID or the canonical major name;
+# category is the degree level or the Major_Category column of majors.csv
+EducationMatch = namedtuple("EducationMatch", ["kind", "id", "category", "start", "end", "text"])
+
+# (degree ID, level, case-insensitive forms, case-sensitive forms). Spelled-out names come first so
+# "Bachelor of Technology" is preferred over a bare "Bachelor". Two-letter abbreviations (BE, MA, ...)
+# must be capitalised, otherwise "be"/"ma" in ordinary prose would count as degrees.
+DEGREES = [
+    ("btech", "bachelor", [r"b\.?\s?tech", r"bachelor\s+of\s+technology"], []),
+    ("be", "bachelor", [r"bachelor\s+of\s+engineering"], [r"B\.?\s?E"]),
+    ("bsc", "bachelor", [r"b\.?\s?sc", r"bachelor\s+of\s+science"], [r"B\.?\s?S"]),
+    ("bca", "bachelor", [r"b\.?\s?c\.?\s?a", r"bachelor\s+of\s+computer\s+applications"], []),
+    ("ba", "bachelor", [r"bachelor\s+of\s+arts"], [r"B\.?\s?A"]),
+    ("mtech", "master", [r"m\.?\s?tech", r"master\s+of\s+technology"], []),
+    ("me", "master", [r"master\s+of\s+engineering"], [r"M\.?\s?E"]),
+    ("msc", "master", [r"m\.?\s?sc", r"master\s+of\s+science"], [r"M\.?\s?S"]),
+    ("mca", "master", [r"m\.?\s?c\.?\s?a", r"master\s+of\s+computer\s+applications"], []),
+    ("mba", "master", [r"mba", r"master\s+of\s+business\s+administration"], []),
+    ("ma", "master", [r"master\s+of\s+arts"], [r"M\.?\s?A"]),
+    ("phd", "doctorate", [r"ph\.?\s?d", r"doctorate"], []),
+    ("bachelor", "bachelor", [r"bachelor(?:'?s)?"], []),
+    ("master", "master", [r"master(?:'?s)?"], []),
+]
+
+
+def compile_degree_pattern(degrees=DEGREES):
+    """
+    One regex for every degree, with a named group per degree ID so a match reports which one it was.
+    """
+    groups = []
+    for degree_id, _, insensitive, sensitive in degrees:
+        forms = [f"(?i:{form})" for form in insensitive] + sensitive
+        groups.append(f"(?P<{degree_id}>{'|'.join(forms)})")
+    return re.compile(r"\b(?:" + "|".join(groups) + r")\b")
+
+
+def load_major_categories(csv_file):
+    with open(csv_file, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        next(reader)  # Skip header
+        return {row[0].strip(): row[1].strip() for row in reader if row and row[0].strip()}
+
+
+class EducationMatcher:
+    """
+    Degree regex and majors automaton, built once and reused for every resume.
+    """
+    def __init__(self, major_categories):
+        self.degree_pattern = compile_degree_pattern()
+        self.degree_levels = {degree_id: level for degree_id, level, _, _ in DEGREES}
+        self.major_categories = major_categories
+        self.major_automaton = KeywordAutomaton(major_categories)
+
+    def find_degrees(self, text):
+        return [
+            EducationMatch("degree", m.lastgroup, self.degree_levels[m.lastgroup], m.start(), m.end(), m.group(0))
+            for m in self.degree_pattern.finditer(text)
+        ]
+
+    def find_majors(self, text):
+        return [
+            EducationMatch("major", m.keyword, self.major_categories[m.keyword], m.start, m.end, text[m.start:m.end])
+            for m in self.major_automaton.find_all(text)
+        ]
+
+    def find_all(self, text):
+        """
+        Returns every degree and major mention as EducationMatch tuples, in text order.
+        """
+        return sorted(self.find_degrees(text) + self.find_majors(text), key=lambda m: (m.start, -m.end))
+
+
+@lru_cache(maxsize=None)
+def get_education_matcher(majors_csv="data/majors.csv"):
+    return EducationMatcher(load_major_categories(majors_csv))
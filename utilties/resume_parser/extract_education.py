@@ -1,101 +1,58 @@
-import spacy
-import re
-import csv
-from utilties.resume_parser.common import is_likely_section_heading
-
-# Load the spaCy model for English
-nlp = spacy.load('en_core_web_sm')
+from utilties.resume_parser.resume_document import ResumeDocument
+from utilties.resume_parser.education_matcher import get_education_matcher
+from utilties.resume_parser.institution_matcher import get_institution_matcher
 
 class ExtractEducation:
-    def __init__(self):
-        pass
+    def __init__(self, majors_csv="data/majors.csv"):
+        # Degree regex and majors automaton are compiled once per process, not per resume
+        self.matcher = get_education_matcher(majors_csv)
     
-    def extract_education(self, text):
-        lines = text.splitlines()
-        education_keywords = ['education', 'academics', 'qualification', 'educational background', 'academic background']
-        stop_keywords = ['experience', 'skills', 'projects', 'certifications', 'summary', 'contact', 'profile', 'about me', 'interests', 'hobbies',
-                         'awards', 'achievements', 'references', 'extracurricular', 'activities', 'courses', 'training',
-                         'seminars', 'conferences', 'workshops', 'publications', 'patents', 'research',
-                         'professional affiliations', 'associations', 'languages', 'work experience', 'career summary', 'job history',
-                         'employment history', 'professional experience', 'job experience', 'work summary', 'technical expertise and skills',
-                         'academic projects' ]
-        
-        # Locate the education section
-        start_idx = None
-        for i, line in enumerate(lines):
-            if is_likely_section_heading(line, education_keywords):
-                start_idx = i
-                break
-        
-        if start_idx is None:
-            return []
-
-        education_lines = []
-        for line in lines[start_idx + 1:]:
-            if is_likely_section_heading(line, stop_keywords):
-                break
-            education_lines.append(line.strip())
-
-        education_text = "\n".join(education_lines)
+    def extract_education(self, document):
+        return self.extract_education_batch([document])[0]
+
+    def extract_education_batch(self, documents, batch_size=64):
+        """
+        Bulk version of extract_education: the institution NER fallback runs in one nlp.pipe
+        pass over the education sections of every document. It runs in-process, since bulk
+        ingest already calls it from pool workers, which cannot start processes of their own.
+        """
+        documents = [ResumeDocument.of(document) for document in documents]
+
+        # The education section was located once when each document was segmented
+        sections = [
+            [line.strip() for line in document.section_lines('education')] if document.has_section('education') else None
+            for document in documents
+        ]
+
+        # Gazetteer and regex first; spaCy NER only for the remaining lines, in one batch
+        institutions = self.extract_universities_batch([lines or [] for lines in sections], batch_size)
+
+        results = []
+        for lines, universities in zip(sections, institutions):
+            if lines is None:
+                results.append({})
+                continue
 
-        # Use spaCy to extract university/college names
-        universities = self.extract_universities(education_text)
-        # doc = nlp(education_text)
-        # universities = [ent.text for ent in doc.ents if ent.label_ == "ORG" and any(kw in ent.text.lower() for kw in ["university", "college", "institute", "iit", "iiit", "nit", "iisc"])]
+            education_text = "\n".join(lines)
 
-        # Extract degrees using regex
-        degree_pattern = r"\b(?:B\.?\s?Tech|M\.?\s?Tech|B\.?\s?E|M\.?\s?E|B\.?\s?Sc|M\.?\s?Sc|B\.?\s?C\.?\s?A|M\.?\s?C\.?\s?A|B\.?\s?A|M\.?\s?A|MBA|Ph\.?\s?D|Bachelor(?:\s+of\s+(?:Technology|Science|Engineering|Arts|Computer\s+Applications))?|Master(?:\s+of\s+(?:Technology|Science|Engineering|Arts|Business\s+Administration|Computer\s+Applications)))(?:/\s?(?:B\.?\s?Tech|M\.?\s?Tech|B\.?\s?E|M\.?\s?E|B\.?\s?Sc|M\.?\s?Sc|B\.?\s?C\.?\s?A|M\.?\s?C\.?\s?A|B\.?\s?A|M\.?\s?A|MBA|Ph\.?\s?D))?\b"
+            # Extract degrees using the precompiled degree regex
+            degrees = [match.text for match in self.matcher.find_degrees(education_text)]
 
-        degrees = re.findall(degree_pattern, education_text, re.IGNORECASE)
+            majors = self.extract_major(education_text)
 
-        majors = self.extract_major(education_text)
+            results.append({
+                "degrees": list(set(degrees)),
+                "institutions": universities,
+                "majors": majors
+            })
+        return results
 
-        return {
-            "degrees": list(set(degrees)),
-            "institutions": universities,
-            "majors": majors
-        }
-    
     def extract_universities(self, text):
-        universities = []
-
-        # Regex pattern to match institutes with optional hyphen or space and ignore case
-        pattern = r"\b(?:" \
-                r"IISc[-\s]?(?:Bangalore|Bengaluru|Bangaluru)|" \
-                r"IIT[-\s]?[A-Z][a-z]+|" \
-                r"NIT[-\s]?[A-Z][a-z]+|" \
-                r"IIIT[-\s]?[A-Z][a-z]+|" \
-                r"BITS[-\s]?[A-Z][a-z]+)\b"
+        return self.extract_universities_batch([text.splitlines()])[0]
 
-        matches = re.findall(pattern, text, flags=re.IGNORECASE)
-        universities.extend(matches)
+    def extract_universities_batch(self, line_groups, batch_size=64):
+        return get_institution_matcher().find_batch(line_groups, batch_size=batch_size)
 
-        # spaCy-based fallback
-        for line in text.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            doc = nlp(line)
-            for ent in doc.ents:
-                if ent.label_ == "ORG":
-                    org_text = ent.text.strip()
-                    if any(keyword in org_text.lower() for keyword in ["university", "college", "institute", "iit", "iiit", "nit", "iisc", "bits", "bit", "vit", ]):
-                        universities.append(org_text)
-
-        return list(set(universities))  # Remove duplicates
-    
     def extract_major(self, text):
-        doc = nlp(text)
-        major_keywords = self.load_major_keywords('data/majors.csv')
-        major_keywords.remove("Major")
-        majors = []
-        for keyword in major_keywords:
-            if keyword.lower() in doc.text.lower():
-                majors.append(keyword)
-
-        return list(set(majors))  # Return unique majors
-    
-    def load_major_keywords(self, file_path):
-        with open(file_path, 'r') as file:
-            reader = csv.reader(file)
-            return set(row[0] for row in reader)
\ No newline at end of file
+        majors = [match.id for match in self.matcher.find_majors(text)]
+        return list(dict.fromkeys(majors))  # Return unique majors
@@ -1,17 +1,14 @@
 import re
 from nameparser import HumanName
-import spacy
-
-# Load the spaCy model for English
-nlp = spacy.load('en_core_web_sm')
+from utilties.resume_parser.nlp_provider import ner
+from utilties.resume_parser.resume_document import ResumeDocument
 
 class ExtractName:
     def __init__(self):
         pass
 
-    def extract_name(self, text):
-        lines = text.strip().split('\n')
-        lines = [line.strip() for line in lines if line.strip() != ""]
+    def extract_name(self, document):
+        lines = ResumeDocument.of(document).non_empty_lines
 
         # Consider only top 10 lines
         for line in lines[:10]:
@@ -26,7 +23,7 @@ class ExtractName:
 
         # Fallback: try spaCy NER only on first 10 lines
         first_10_lines = "\n".join(lines[:10])
-        doc = nlp(first_10_lines)
+        doc = ner(first_10_lines)
         for ent in doc.ents:
             if ent.label_ == 'PERSON':
                 name = HumanName(ent.text)
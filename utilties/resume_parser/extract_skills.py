@@ -1,16 +1,23 @@
 import os
 import ast
-import csv
-from transformers import AutoTokenizer, AutoModelForTokenClassification, pipeline
-from llama_cpp import Llama
 import re
+from utilties.resume_parser.model_registry import model_registry
+from utilties.resume_parser.skill_matcher import get_skill_matcher
+from utilties.resume_parser.skill_taxonomy import get_skill_taxonomy
+from utilties.resume_parser.llm_worker import get_llm_worker, SKILLS_PROMPT_PREFIX, SKILLS_PROMPT_SUFFIX
 
 
 class ExtractSkills:
-    def __init__(self, csv_file="data/skills.csv", use_llm = False, gemma_model_path=r"llm_model\gemma\gemma-2-9b-it-Q4_K_M-fp16.gguf"):
+    def __init__(self, csv_file="data/Skills.csv", use_llm = False, gemma_model_path=r"llm_model\gemma\gemma-2-9b-it-Q4_K_M-fp16.gguf",
+                 llm_concurrency=1, llm_timeout=120):
         self.csv_file = csv_file
         self.gemma_model_path = gemma_model_path
         self.use_llm=use_llm
+        self.llm_concurrency = llm_concurrency
+        self.llm_timeout = llm_timeout
+        # Every source reports skills in the taxonomy's spelling, so "Node.Js" from the CSV path,
+        # "Nodejs" from NER and "node.js" from the LLM are one skill
+        self.taxonomy = get_skill_taxonomy(csv_file)
 
     def extract_skills(self, text):
         """
@@ -19,9 +26,9 @@ class ExtractSkills:
         2. NER model
         3. LLM (Gemma 2)
         
-        Returns a set of unique skills.
+        Returns the unique skills: vocabulary skills in taxonomy ID order, then the others.
         """
-        csv_skills = self.extract_skills_from_csv(text)
+        csv_skills = self.extract_skills_from_csv(text, self.csv_file)
         ner_skills = self.extract_skills_from_ner(text)
         if self.use_llm:
             llm_skills = self.extract_skills_from_llm(text)
@@ -29,22 +36,36 @@ class ExtractSkills:
             llm_skills = set()
 
 
-        return list(csv_skills.union(ner_skills).union(llm_skills))
+        return self.taxonomy.canonical_set(sorted(csv_skills | ner_skills | llm_skills))
+
+    def extract_skills_batch(self, texts):
+        """
+        Bulk version of extract_skills: NER inference is batched across every text.
+        """
+        ner_skills = self.extract_skills_from_ner_batch(texts)
+        results = []
+        for text, ner_set in zip(texts, ner_skills):
+            csv_skills = self.extract_skills_from_csv(text, self.csv_file)
+            llm_skills = self.extract_skills_from_llm(text) if self.use_llm else set()
+            results.append(self.taxonomy.canonical_set(sorted(csv_skills | ner_set | llm_skills)))
+        return results
     
-    def extract_skills_from_csv(self, text, csv_file="data/skills.csv"):
+    def extract_skills_from_csv(self, text, csv_file="data/Skills.csv"):
         skills = set()
         try:
-            with open(csv_file, newline='', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                next(reader)  # Skip header
-                for row in reader:
-                    keyword = row[0].strip().lower()
-                    if keyword in text.lower():
-                        skills.add(keyword.title())
+            # The automaton is compiled once per vocabulary file and scans the text in a single pass
+            matcher = get_skill_matcher(csv_file)
+            for match in matcher.find_all(text):
+                skills.add(self.taxonomy.canonical(match.keyword))
         except Exception as e:
             print(f"[ERROR] CSV skill extraction: {e}")
         return skills
 
+    def canonical_skill(self, word):
+        # Skills outside the vocabulary are title-cased, as before the taxonomy
+        word = word.strip()
+        return self.taxonomy.canonical(word, word.title())
+
     def clean_skill(self, word):
         # Keep only allowed chars (letters, digits, space, + . -)
         word = ''.join(c for c in word if c.isalnum() or c.isspace() or c in ['+', '.', '-'])
@@ -56,55 +77,96 @@ class ExtractSkills:
         return word
 
     def extract_skills_from_ner(self, text, use_custom_model=False):
-        try:
-            if use_custom_model:
-                model_dir = "ner_model/skill_ner_model"
-                tokenizer = AutoTokenizer.from_pretrained(model_dir)
-                model = AutoModelForTokenClassification.from_pretrained(model_dir)
-            else:
-                model_name = "Nucha/Nucha_SkillNER_BERT"
-                tokenizer = AutoTokenizer.from_pretrained(model_name)
-                model = AutoModelForTokenClassification.from_pretrained(model_name)
+        return self.extract_skills_from_ner_batch([text], use_custom_model=use_custom_model)[0]
 
-            ner_pipeline = pipeline("ner", model=model, tokenizer=tokenizer, aggregation_strategy="max")
+    def extract_skills_from_ner_batch(self, texts, use_custom_model=False, window_tokens=None, overlap_tokens=32, batch_size=16):
+        """
+        Runs skill NER over many documents at once.
+        Each text is cut into overlapping windows that fit the model, windows from all texts are
+        pushed through the pipeline as padded batches, and entities are mapped back to their document.
 
-            pattern = re.compile(r'^[\w\s\+\.\-]+$')
+        Returns one set of skills per input text, in input order.
+        """
+        try:
+            # The registry loads the tokenizer/model once per process and hands back the shared pipeline
+            loaded = model_registry.get(model_registry.resolve_name(use_custom_model))
+
+            if window_tokens is None:
+                window_tokens = min(loaded.tokenizer.model_max_length, 512) - 2
+
+            window_texts = []
+            owners = []
+            for doc_idx, text in enumerate(texts):
+                for start, end in self.split_into_windows(loaded.tokenizer, text, window_tokens, overlap_tokens):
+                    window_texts.append(text[start:end])
+                    owners.append((doc_idx, start))
+
+            entities_per_doc = [[] for _ in texts]
+            if window_texts:
+                # Batching similar lengths together keeps padding per batch small
+                order = sorted(range(len(window_texts)), key=lambda i: len(window_texts[i]))
+                outputs = loaded.pipeline([window_texts[i] for i in order], batch_size=batch_size)
+                for i, entities in zip(order, outputs):
+                    doc_idx, offset = owners[i]
+                    for ent in entities:
+                        entities_per_doc[doc_idx].append(dict(ent, start=ent['start'] + offset, end=ent['end'] + offset))
 
-            entities = ner_pipeline(text)
-            skills = set()
-            for ent in entities:
-                if ent['entity_group'].upper() == "HSKILL":
-                    word = ent['word'].strip()
-                    word = self.clean_skill(word)
-                    if len(word) >= 3 and pattern.match(word):
-                        skills.add(word.title())
-            return skills
+            pattern = re.compile(r'^[\w\s\+\.\-]+$')
+            results = []
+            for entities in entities_per_doc:
+                skills = set()
+                for ent in self.merge_overlapping_entities(entities):
+                    if ent['entity_group'].upper() == "HSKILL":
+                        word = ent['word'].strip()
+                        word = self.clean_skill(word)
+                        if len(word) >= 3 and pattern.match(word):
+                            skills.add(self.canonical_skill(word))
+                results.append(skills)
+            return results
         except Exception as e:
             print(f"[ERROR] NER skill extraction: {e}")
-            return set()
+            return [set() for _ in texts]
 
-
-    def extract_skills_from_llm(self, text, gemma_model_path=r"llm_model\gemma\gemma-2-9b-it-Q4_K_M-fp16.gguf"):
+    def split_into_windows(self, tokenizer, text, window_tokens, overlap_tokens):
+        """
+        Returns (start, end) character spans covering the text, each at most window_tokens tokens long
+        and overlapping the previous one by overlap_tokens, always cut on token boundaries.
+        """
+        offsets = tokenizer(text, add_special_tokens=False, return_offsets_mapping=True)['offset_mapping']
+        if not offsets:
+            return []
+
+        step = max(window_tokens - overlap_tokens, 1)
+        windows = []
+        for first in range(0, len(offsets), step):
+            last = min(first + window_tokens, len(offsets)) - 1
+            windows.append((offsets[first][0], offsets[last][1]))
+            if last == len(offsets) - 1:
+                break
+        return windows
+
+    def merge_overlapping_entities(self, entities):
+        """
+        Entities found twice in the overlap between two windows are collapsed,
+        keeping the highest scoring span wherever spans overlap.
+        """
+        merged = []
+        for ent in sorted(entities, key=lambda e: (e['start'], -e['end'])):
+            if merged and ent['start'] < merged[-1]['end']:
+                if ent['score'] > merged[-1]['score']:
+                    merged[-1] = ent
+                continue
+            merged.append(ent)
+        return merged
+
+    def extract_skills_from_llm(self, text, gemma_model_path=None):
         try:
-            llm = Llama(
-                model_path=gemma_model_path,
-                n_ctx=2048,
-                n_threads=8,
-                n_batch=32,
-                verbose=False
-            )
-
-            prompt = f"""You are an expert HR assistant.
-Given the following resume text, extract only relevant skills.
-Respond with a Python list of skills as strings.
-
-Resume:
-{text}
-
-Skills:
-"""
+            # The worker keeps the GGUF loaded across resumes and queues requests to it
+            worker = get_llm_worker(gemma_model_path or self.gemma_model_path, concurrency=self.llm_concurrency)
+
+            prompt = SKILLS_PROMPT_PREFIX + text + SKILLS_PROMPT_SUFFIX
             # Generate completion
-            response = llm(prompt, max_tokens=256, stop=["</s>", "\n\n"])
+            response = worker.complete(prompt, timeout=self.llm_timeout, max_tokens=256, stop=["</s>", "\n\n"])
 
             # 'response' is a dict with 'choices', each having 'text'
             output = response['choices'][0]['text']
@@ -112,8 +174,8 @@ Skills:
             # Convert string list output to Python list
             skills = ast.literal_eval(output.strip())
 
-            # Return skills as a set, title-cased
-            return set(s.strip().title() for s in skills if isinstance(s, str))
+            # Return skills as a set, in the taxonomy's spelling
+            return set(self.canonical_skill(s) for s in skills if isinstance(s, str) and s.strip())
         except Exception as e:
             print(f"[ERROR] LLM skill extraction: {e}")
             return set()
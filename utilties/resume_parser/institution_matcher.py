@@ -0,0 +1,87 @@
+import csv
+import re
+from functools import lru_cache
+
+from spacy.matcher import PhraseMatcher
+
+from utilties.resume_parser.nlp_provider import get_nlp, ner_pipe
+
+# Abbreviated institute names the gazetteer cannot enumerate (IIT Bombay, NIT-Trichy, ...)
+INSTITUTION_PATTERN = re.compile(
+    r"\b(?:"
+    r"IISc[-\s]?(?:Bangalore|Bengaluru|Bangaluru)|"
+    r"IIT[-\s]?[A-Z][a-z]+|"
+    r"NIT[-\s]?[A-Z][a-z]+|"
+    r"IIIT[-\s]?[A-Z][a-z]+|"
+    r"BITS[-\s]?[A-Z][a-z]+)\b",
+    re.IGNORECASE
+)
+
+# An ORG entity only counts as an institution when it contains one of these
+INSTITUTION_KEYWORDS = ("university", "college", "institute", "iit", "iiit", "nit", "iisc", "bits", "bit", "vit")
+
+
+def mentions_institution_keyword(text):
+    lowered = text.lower()
+    return any(keyword in lowered for keyword in INSTITUTION_KEYWORDS)
+
+
+def load_institution_gazetteer(csv_file):
+    with open(csv_file, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        next(reader)  # Skip header
+        return [row[0].strip() for row in reader if row and row[0].strip()]
+
+
+class InstitutionMatcher:
+    """
+    Finds institution names in the lines of an education section.
+
+    Each line is first checked against a gazetteer of known institutions (spaCy PhraseMatcher over
+    lowercased tokens, tokenizer only) and the abbreviation regex. Only lines with no hit that still
+    mention an institution keyword go through the statistical NER model, all in one nlp.pipe batch.
+    """
+    def __init__(self, names):
+        self.nlp = get_nlp()
+        self.phrase_matcher = PhraseMatcher(self.nlp.vocab, attr="LOWER")
+        for name in names:
+            self.phrase_matcher.add(name, [self.nlp.make_doc(name)])
+
+    def gazetteer_matches(self, line):
+        doc = self.nlp.make_doc(line)
+        return [self.nlp.vocab.strings[match_id] for match_id, _, _ in self.phrase_matcher(doc)]
+
+    def find_batch(self, line_groups, batch_size=64, n_process=1):
+        """
+        Takes one list of lines per resume and returns one list of institutions per resume.
+        The NER fallback for every resume runs in a single batched pass.
+        """
+        results = [[] for _ in line_groups]
+        fallback_lines, fallback_owners = [], []
+
+        for owner, lines in enumerate(line_groups):
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
+                hits = self.gazetteer_matches(line) + INSTITUTION_PATTERN.findall(line)
+                if hits:
+                    results[owner].extend(hits)
+                elif mentions_institution_keyword(line):
+                    fallback_lines.append(line)
+                    fallback_owners.append(owner)
+
+        for owner, doc in zip(fallback_owners, ner_pipe(fallback_lines, batch_size=batch_size, n_process=n_process)):
+            for ent in doc.ents:
+                if ent.label_ == "ORG" and mentions_institution_keyword(ent.text):
+                    results[owner].append(ent.text.strip())
+
+        return [list(dict.fromkeys(found)) for found in results]  # Remove duplicates, keep order
+
+    def find(self, lines):
+        return self.find_batch([lines])[0]
+
+
+@lru_cache(maxsize=None)
+def get_institution_matcher(csv_file="data/institutions.csv"):
+    return InstitutionMatcher(load_institution_gazetteer(csv_file))
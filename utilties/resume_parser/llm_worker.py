@@ -0,0 +1,143 @@
+import queue
+import threading
+from concurrent.futures import Future
+
+SKILLS_PROMPT_PREFIX = """You are an expert HR assistant.
+Given the following resume text, extract only relevant skills.
+Respond with a Python list of skills as strings.
+
+Resume:
+"""
+SKILLS_PROMPT_SUFFIX = """
+
+Skills:
+"""
+
+_STOP = object()
+
+
+def default_llama_factory(model_path, n_ctx, n_threads, n_batch):
+    # llama-cpp is only needed when the LLM path is enabled, so import it lazily
+    from llama_cpp import Llama
+    return Llama(
+        model_path=model_path,
+        n_ctx=n_ctx,
+        n_threads=n_threads,
+        n_batch=n_batch,
+        verbose=False
+    )
+
+
+class LlamaWorker:
+    """
+    Keeps a GGUF model resident for the life of the process and serializes completions through a queue.
+
+    Each worker thread owns its own llama context (they are not thread-safe), so `concurrency`
+    is also the number of model copies held in memory. The fixed prompt prefix is evaluated once
+    at startup; llama-cpp reuses the longest matching token prefix already in the KV cache, so
+    later prompts that start with it only pay for the resume text.
+    """
+    def __init__(self, model_path, concurrency=1, n_ctx=2048, n_threads=8, n_batch=32,
+                 prompt_prefix=SKILLS_PROMPT_PREFIX, llama_factory=default_llama_factory):
+        # With no worker threads every completion would wait on the queue forever
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        self.model_path = model_path
+        self.prompt_prefix = prompt_prefix
+        self._factory_args = (model_path, n_ctx, n_threads, n_batch)
+        self._llama_factory = llama_factory
+        self._queue = queue.Queue()
+        self._ready = threading.Barrier(concurrency + 1)
+        self._load_errors = []
+
+        self._threads = []
+        for i in range(concurrency):
+            thread = threading.Thread(target=self._run, name=f"llama-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+        # Wait for every model to load so a broken model path fails here, not on the first resume
+        self._ready.wait()
+        if self._load_errors:
+            self.shutdown()
+            raise self._load_errors[0]
+
+    def _run(self):
+        try:
+            llm = self._llama_factory(*self._factory_args)
+            self._warm_prefix(llm)
+        except Exception as e:
+            self._load_errors.append(e)
+            self._ready.wait()
+            return
+        self._ready.wait()
+
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            future, prompt, kwargs = item
+            # Requests whose caller already gave up (timeout/cancel) are skipped
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(llm(prompt, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+
+    def _warm_prefix(self, llm):
+        if not self.prompt_prefix or not hasattr(llm, "eval"):
+            return
+        llm.eval(llm.tokenize(self.prompt_prefix.encode("utf-8")))
+
+    def submit(self, prompt, **kwargs):
+        future = Future()
+        self._queue.put((future, prompt, kwargs))
+        return future
+
+    def complete(self, prompt, timeout=None, **kwargs):
+        """
+        Queues a completion and waits for it. Raises concurrent.futures.TimeoutError after `timeout`
+        seconds; a request that has not started by then is dropped from the queue.
+        """
+        future = self.submit(prompt, **kwargs)
+        try:
+            return future.result(timeout=timeout)
+        except Exception:
+            future.cancel()
+            raise
+
+    def pending(self):
+        return self._queue.qsize()
+
+    def shutdown(self):
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+
+
+_workers = {}
+_workers_lock = threading.Lock()
+
+
+def get_llm_worker(model_path, concurrency=1, **kwargs):
+    """
+    Returns the process-wide worker for a model, starting it on first use.
+    """
+    worker = _workers.get(model_path)
+    if worker is not None:
+        return worker
+    with _workers_lock:
+        worker = _workers.get(model_path)
+        if worker is None:
+            worker = LlamaWorker(model_path, concurrency=concurrency, **kwargs)
+            _workers[model_path] = worker
+    return worker
+
+
+def shutdown_llm_workers():
+    with _workers_lock:
+        for worker in _workers.values():
+            worker.shutdown()
+        _workers.clear()
@@ -0,0 +1,82 @@
+import threading
+from transformers import AutoTokenizer, AutoModelForTokenClassification, pipeline
+
+DEFAULT_SKILL_NER_MODEL = "Nucha/Nucha_SkillNER_BERT"
+CUSTOM_SKILL_NER_MODEL_DIR = "ner_model/skill_ner_model"
+
+
+class LoadedModel:
+    def __init__(self, name, tokenizer, model, ner_pipeline):
+        self.name = name
+        self.tokenizer = tokenizer
+        self.model = model
+        self.pipeline = ner_pipeline
+
+    def memory_bytes(self):
+        # Parameters and buffers make up practically all of the resident size of a BERT model
+        tensors = list(self.model.parameters()) + list(self.model.buffers())
+        return sum(t.numel() * t.element_size() for t in tensors)
+
+
+class ModelRegistry:
+    """
+    Process-wide cache of token classification models.
+    Each model is loaded lazily on first use and shared by every caller until unload() is called.
+    """
+    def __init__(self):
+        self._models = {}
+        self._lock = threading.Lock()
+
+    def resolve_name(self, use_custom_model=False):
+        return CUSTOM_SKILL_NER_MODEL_DIR if use_custom_model else DEFAULT_SKILL_NER_MODEL
+
+    def get(self, model_name):
+        loaded = self._models.get(model_name)
+        if loaded is not None:
+            return loaded
+
+        with self._lock:
+            # Another thread may have finished loading while we waited for the lock
+            loaded = self._models.get(model_name)
+            if loaded is None:
+                loaded = self._load(model_name)
+                self._models[model_name] = loaded
+        return loaded
+
+    def get_ner_pipeline(self, use_custom_model=False):
+        return self.get(self.resolve_name(use_custom_model)).pipeline
+
+    def _load(self, model_name):
+        print(f"[INFO] Loading NER model: {model_name}")
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        model = AutoModelForTokenClassification.from_pretrained(model_name)
+        model.eval()
+        ner_pipeline = pipeline("ner", model=model, tokenizer=tokenizer, aggregation_strategy="max")
+        return LoadedModel(model_name, tokenizer, model, ner_pipeline)
+
+    def warmup(self, use_custom_model=False):
+        """
+        Loads the model and runs one tiny inference so the first real request does not pay for it.
+        """
+        ner_pipeline = self.get_ner_pipeline(use_custom_model)
+        ner_pipeline("Python developer")
+
+    def is_loaded(self, model_name):
+        return model_name in self._models
+
+    def unload(self, model_name=None):
+        """
+        Drops one model (or all of them when model_name is None) so its memory can be reclaimed.
+        """
+        with self._lock:
+            if model_name is None:
+                self._models.clear()
+            else:
+                self._models.pop(model_name, None)
+
+    def memory_report(self):
+        return {name: loaded.memory_bytes() for name, loaded in self._models.items()}
+
+
+# Shared by every ExtractSkills instance in the process
+model_registry = ModelRegistry()
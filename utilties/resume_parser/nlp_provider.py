@@ -0,0 +1,56 @@
+import threading
+import spacy
+
+SPACY_MODEL_NAME = 'en_core_web_sm'
+
+_nlp = None
+_lock = threading.Lock()
+
+
+def get_nlp():
+    """
+    Returns the process-wide spaCy pipeline, loading it on first use.
+    """
+    global _nlp
+    if _nlp is None:
+        with _lock:
+            if _nlp is None:
+                _nlp = spacy.load(SPACY_MODEL_NAME)
+    return _nlp
+
+
+def components_for(nlp, needed):
+    """
+    Returns the pipe names that must run to produce `needed`, including a shared tok2vec
+    only when one of the needed components listens to it.
+    """
+    enabled = [name for name in needed if name in nlp.pipe_names]
+    if "tok2vec" in nlp.pipe_names:
+        listeners = nlp.get_pipe("tok2vec").listening_components
+        if any(name in listeners for name in enabled):
+            enabled.insert(0, "tok2vec")
+    return enabled
+
+
+def disabled_for(nlp, needed):
+    enabled = components_for(nlp, needed)
+    return [name for name in nlp.pipe_names if name not in enabled]
+
+
+def ner(text):
+    """
+    Runs only the entity recognizer (no tagger, parser, lemmatizer...) over a single text.
+    """
+    nlp = get_nlp()
+    # Disabling per call, rather than with nlp.select_pipes(), keeps the shared pipeline
+    # untouched so it can be used from several threads at once
+    return nlp(text, disable=disabled_for(nlp, ["ner"]))
+
+
+def ner_pipe(texts, batch_size=64, n_process=1):
+    """
+    Batched version of ner(): yields one doc per text, in order. n_process > 1 forks worker
+    processes, which only pays off for large bulk runs.
+    """
+    nlp = get_nlp()
+    return nlp.pipe(texts, batch_size=batch_size, n_process=n_process, disable=disabled_for(nlp, ["ner"]))
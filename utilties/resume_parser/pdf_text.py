@@ -0,0 +1,150 @@
+import fitz  # PyMuPDF
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+# A line of text with the styling of its largest span; page is 0-based
+TextLine = namedtuple("TextLine", ["text", "size", "bold", "page"])
+
+BOLD_FLAG = 16
+# A line counts as styled like a heading when its font is this much larger than the body text
+HEADING_SIZE_RATIO = 1.15
+# Blocks starting within this fraction of the page width of the centre still count as one column
+COLUMN_TOLERANCE = 0.05
+# A right-hand block whose top is within this many points of a left-hand block's top sits on the
+# same row as it (a title with its dates), rather than in a column of its own
+ROW_TOLERANCE = 3.0
+
+
+def span_is_bold(span):
+    return bool(span["flags"] & BOLD_FLAG) or "bold" in span["font"].lower()
+
+
+def order_blocks(blocks, page_width):
+    """
+    Reading order for text blocks: top to bottom, except that side-by-side columns are read one
+    after the other. Blocks spanning the centre of the page (a full-width header, say) split the
+    page into bands, and within a band the left column is emitted before the right one.
+    """
+    centre = page_width / 2
+    tolerance = page_width * COLUMN_TOLERANCE
+    ordered, left, right = [], [], []
+
+    def flush():
+        if is_two_columns(left, right):
+            ordered.extend(sorted(left, key=lambda b: (b["bbox"][1], b["bbox"][0])))
+            ordered.extend(sorted(right, key=lambda b: (b["bbox"][1], b["bbox"][0])))
+        else:
+            ordered.extend(sorted(left + right, key=lambda b: (b["bbox"][1], b["bbox"][0])))
+        left.clear()
+        right.clear()
+
+    for block in sorted(blocks, key=lambda b: (b["bbox"][1], b["bbox"][0])):
+        x0, _, x1, _ = block["bbox"]
+        if x1 <= centre + tolerance:
+            left.append(block)
+        elif x0 >= centre - tolerance:
+            right.append(block)
+        else:
+            flush()
+            ordered.append(block)
+    flush()
+    return ordered
+
+
+def is_two_columns(left, right):
+    """
+    A band is two columns when each side holds several blocks, the two sides run alongside each
+    other, and most right-hand blocks do not simply share a row with a left-hand one. A single
+    column with right-aligned dates has blocks on both sides too, but every date is on a row.
+    """
+    if len(left) < 2 or len(right) < 2:
+        return False
+    left_top, left_bottom = min(b["bbox"][1] for b in left), max(b["bbox"][3] for b in left)
+    right_top, right_bottom = min(b["bbox"][1] for b in right), max(b["bbox"][3] for b in right)
+    if min(left_bottom, right_bottom) <= max(left_top, right_top):
+        return False
+    left_tops = [b["bbox"][1] for b in left]
+    on_rows = sum(1 for b in right if any(abs(b["bbox"][1] - top) <= ROW_TOLERANCE for top in left_tops))
+    return on_rows * 2 < len(right)
+
+
+def extract_page_lines(page, page_number=None):
+    """
+    Returns the TextLines of one page in reading order, built from get_text("dict") so each
+    line keeps its font size and weight.
+    """
+    page_number = page.number if page_number is None else page_number
+    blocks = [b for b in page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)["blocks"] if b.get("type", 0) == 0]
+    lines = []
+    for block in order_blocks(blocks, page.rect.width):
+        for line in block["lines"]:
+            spans = [span for span in line["spans"] if span["text"].strip()]
+            if not spans:
+                continue
+            text = "".join(span["text"] for span in line["spans"]).strip()
+            size = max(span["size"] for span in spans)
+            bold = all(span_is_bold(span) for span in spans)
+            lines.append(TextLine(text, round(size, 1), bold, page_number))
+    return lines
+
+
+def extract_page_range(binary_pdf, start, end):
+    # Runs in a worker process: each one opens its own document, since fitz objects are not shareable
+    doc = fitz.open(stream=binary_pdf, filetype="pdf")
+    return [extract_page_lines(doc[i], i) for i in range(start, end)]
+
+
+@lru_cache(maxsize=None)
+def get_page_pool(max_workers):
+    return ProcessPoolExecutor(max_workers=max_workers)
+
+
+class PdfText:
+    """
+    The text of a PDF as styled lines. text joins them with newlines (one line per TextLine), and
+    heading_lines holds the indices of lines set larger or bolder than the body text.
+    """
+    def __init__(self, lines):
+        self.lines = lines
+        self.text = "\n".join(line.text for line in lines)
+        self.body_size = self.most_common_size(lines)
+        self.heading_lines = {i for i, line in enumerate(lines) if self.is_styled_heading(line)}
+
+    @staticmethod
+    def most_common_size(lines):
+        # Weighted by characters, so a few large headings never outvote the body text
+        weights = {}
+        for line in lines:
+            weights[line.size] = weights.get(line.size, 0) + len(line.text)
+        return max(weights, key=weights.get) if weights else 0.0
+
+    def is_styled_heading(self, line):
+        if len(line.text.split()) > 5:
+            return False
+        larger = self.body_size and line.size >= self.body_size * HEADING_SIZE_RATIO
+        return bool(larger or line.bold)
+
+
+def extract_pdf_text(binary_pdf, page_workers=None, parallel_min_pages=8):
+    """
+    Extracts layout-ordered, styled text from PDF bytes. With page_workers > 1, documents of at
+    least parallel_min_pages pages are split into page ranges and extracted on a process pool.
+    """
+    doc = fitz.open(stream=binary_pdf, filetype="pdf")
+    page_count = doc.page_count
+
+    if page_workers and page_workers > 1 and page_count >= parallel_min_pages:
+        doc.close()
+        step = -(-page_count // page_workers)
+        pool = get_page_pool(page_workers)
+        # memoryviews cannot be pickled across to the workers
+        data = bytes(binary_pdf)
+        futures = [pool.submit(extract_page_range, data, start, min(start + step, page_count))
+                   for start in range(0, page_count, step)]
+        pages = [page for future in futures for page in future.result()]
+    else:
+        pages = [extract_page_lines(page) for page in doc]
+        doc.close()
+
+    return PdfText([line for page in pages for line in page])
@@ -0,0 +1,41 @@
+from utilties.resume_parser.common import SectionSegmenter
+
+
+class ResumeDocument:
+    """
+    Resume text split into lines and sections once, then shared by every extractor.
+    sections maps a section name (see common.RESUME_SECTIONS) to the (start, end) line range of its
+    first occurrence, where lines[start] is the heading and end is exclusive.
+
+    heading_lines optionally lists the indices of lines the PDF styles as headings
+    (see pdf_text.PdfText), which lets headings with punctuation be recognised.
+    """
+    segmenter = SectionSegmenter()
+
+    def __init__(self, text, heading_lines=()):
+        self.text = text
+        self.lines = text.splitlines()
+        self.heading_lines = set(heading_lines)
+        self.non_empty_lines = [line.strip() for line in self.lines if line.strip() != ""]
+
+        self.sections = {}
+        for name, start, end in self.segmenter.segment(self.lines, self.heading_lines):
+            self.sections.setdefault(name, (start, end))
+
+    @classmethod
+    def of(cls, text_or_document):
+        if isinstance(text_or_document, cls):
+            return text_or_document
+        return cls(text_or_document)
+
+    def has_section(self, name):
+        return name in self.sections
+
+    def section_lines(self, name, include_heading=False):
+        if name not in self.sections:
+            return []
+        start, end = self.sections[name]
+        return self.lines[start if include_heading else start + 1:end]
+
+    def section_text(self, name, include_heading=False):
+        return "\n".join(self.section_lines(name, include_heading))
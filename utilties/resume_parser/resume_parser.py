@@ -1,15 +1,33 @@
-import fitz  # PyMuPDF
+import time
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from utilties.resume_parser.extract_name import ExtractName
 from utilties.resume_parser.extract_email import ExtractEmail
 from utilties.resume_parser.extract_phone_number import ExtractPhone
 from utilties.resume_parser.extract_total_experience import ExtractTotalExperience
 from utilties.resume_parser.extract_education import ExtractEducation
 from utilties.resume_parser.extract_skills import ExtractSkills
+from utilties.resume_parser.resume_document import ResumeDocument
+from utilties.resume_parser.pdf_text import extract_pdf_text
+
+# Bump whenever a change to the extractors alters their output, so cached parses are not reused
+RESUME_PARSER_VERSION = "11"
+
+
+@lru_cache(maxsize=None)
+def get_extractor_pool(max_workers):
+    # One long-lived pool per size, shared by every ResumeParser in the process
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="resume-extractor")
+
 
 class ResumeParser:
-    def __init__(self, resume_path=None, resume_binary=None):
+    def __init__(self, resume_path=None, resume_binary=None, max_workers=None, page_workers=None):
         self.resume_path = resume_path
         self.resume_binary = resume_binary
+        # None/0/1 runs extractors serially, otherwise they fan out over a thread pool of this size
+        self.max_workers = max_workers
+        # Processes used to extract the pages of long PDFs; keep None inside daemonic pool workers
+        self.page_workers = page_workers
 
     def parse(self):
         # read the resume file
@@ -23,51 +41,103 @@ class ResumeParser:
     def parse_resume_from_file(self):
         with open(self.resume_path, "rb") as file:
             resume_binary = file.read()
-        resume_text = self.extract_resume_info_from_pdf(resume_binary)
-        resume_info = self.extract_resume_info(resume_text)
-        return resume_info
+        return self.parse_pdf_bytes(resume_binary)
     
     def parse_resume_from_binary(self):
-        resume_text = self.extract_resume_info_from_pdf(self.resume_binary)
-        resume_info = self.extract_resume_info(resume_text)
+        return self.parse_pdf_bytes(self.resume_binary)
+
+    def parse_pdf_bytes(self, binary_pdf):
+        start = time.perf_counter()
+        pdf_text = extract_pdf_text(binary_pdf, page_workers=self.page_workers)
+        pdf_seconds = round(time.perf_counter() - start, 4)
+
+        resume_info = self.extract_resume_info(pdf_text.text, pdf_text.heading_lines)
+        resume_info['timings']['pdf_text'] = pdf_seconds
         return resume_info
     
     def extract_resume_info_from_pdf(self, binary_pdf):
-        doc = fitz.open(stream=binary_pdf, filetype="pdf")
-        text = ""
-        for page in doc:
-            text += page.get_text()
-        return text
+        return extract_pdf_text(binary_pdf, page_workers=self.page_workers).text
 
-    def extract_resume_info(self, resume_text):
-        # Extract relevant information from the resume text
-        name_extractor = ExtractName()
-        first_name, last_name = name_extractor.extract_name(resume_text)
+    def extract_resume_info(self, resume_text, heading_lines=()):
+        # Split the text into lines and sections once; every extractor works off this document
+        document = ResumeDocument(resume_text, heading_lines)
 
-        email_extractor = ExtractEmail()
-        email = email_extractor.extract_email(resume_text)
+        # Extract relevant information from the resume text
+        tasks = {
+            **self.document_tasks(document),
+            'education': lambda: ExtractEducation().extract_education(document),
+            'skills': lambda: ExtractSkills(use_llm=False).extract_skills(document.text),
+        }
+        results, timings = self.run_extractors(tasks)
+        return self.resume_info(results, timings)
 
-        phone_extractor = ExtractPhone()
-        phone = phone_extractor.extract_phone(resume_text)
+    def extract_resume_info_batch(self, documents):
+        """
+        Bulk version of extract_resume_info over ResumeDocuments, in input order. The model-backed
+        extractors run once over the whole batch; each resume's timings report an even share of them.
+        """
+        batch_tasks = {
+            # Institution NER for every resume's education section runs in one nlp.pipe pass
+            'education': lambda: ExtractEducation().extract_education_batch(documents),
+            # Skill NER windows from every resume go through the pipeline as shared padded batches
+            'skills': lambda: ExtractSkills(use_llm=False).extract_skills_batch([document.text for document in documents]),
+        }
+        batch_results, batch_timings = self.run_extractors(batch_tasks)
 
-        total_experience_extractor = ExtractTotalExperience()
-        total_experience = total_experience_extractor.extract_total_experience(resume_text)
+        resume_infos = []
+        for i, document in enumerate(documents):
+            results, timings = self.run_extractors(self.document_tasks(document))
+            for name in batch_tasks:
+                results[name] = batch_results[name][i]
+                timings[name] = round(batch_timings[name] / len(documents), 4)
+            resume_infos.append(self.resume_info(results, timings))
+        return resume_infos
 
-        education_extractor = ExtractEducation()
-        education = education_extractor.extract_education(resume_text)
+    def document_tasks(self, document):
+        # The extractors that only look at one resume at a time
+        return {
+            'name': lambda: ExtractName().extract_name(document),
+            'email': lambda: ExtractEmail().extract_email(document.text),
+            'phone': lambda: ExtractPhone().extract_phone(document.text),
+            'total_experience': lambda: ExtractTotalExperience().extract_experience(document),
+        }
 
-        skills_extractor = ExtractSkills(use_llm=False)
-        skills = skills_extractor.extract_skills(resume_text)
+    def resume_info(self, results, timings):
+        first_name, last_name = results['name']
+        education = results['education']
 
-        
         return {
             'first_name': first_name,
             'last_name': last_name,
-            'email': email,
-            'phone': phone,
-            'total_experience': total_experience,
+            'email': results['email'],
+            'phone': results['phone'],
+            'total_experience': ExtractTotalExperience().format_months(results['total_experience']['total_months']),
+            'experience_intervals': results['total_experience']['intervals'],
             'degrees': education.get('degrees', []),
             'institutions': education.get('institutions', []),
             'majors': education.get('majors', []),
-            'skills': skills
+            'skills': results['skills'],
+            'timings': timings
         }
+
+    def run_extractors(self, tasks):
+        """
+        Runs each extractor and returns ({name: result}, {name: seconds}).
+        The transformers/spaCy/llama-cpp extractors spend most of their time outside the GIL,
+        so with a pool the total latency approaches the slowest extractor rather than the sum.
+        """
+        def timed(fn):
+            start = time.perf_counter()
+            result = fn()
+            return result, round(time.perf_counter() - start, 4)
+
+        if self.max_workers and self.max_workers > 1:
+            pool = get_extractor_pool(self.max_workers)
+            futures = {name: pool.submit(timed, fn) for name, fn in tasks.items()}
+            outcomes = {name: future.result() for name, future in futures.items()}
+        else:
+            outcomes = {name: timed(fn) for name, fn in tasks.items()}
+
+        results = {name: outcome[0] for name, outcome in outcomes.items()}
+        timings = {name: outcome[1] for name, outcome in outcomes.items()}
+        return results, timings
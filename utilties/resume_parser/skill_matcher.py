@@ -0,0 +1,115 @@
+import csv
+from collections import deque, namedtuple
+from functools import lru_cache
+
+KeywordMatch = namedtuple("KeywordMatch", ["start", "end", "keyword"])
+
+
+def _lower_same_length(text):
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # A few characters (e.g. 'İ') expand when lowercased, which would shift every offset after them
+    return ''.join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over a fixed keyword list.
+    Matching is case-insensitive, runs in a single pass over the text regardless of how many
+    keywords were compiled, and only reports hits that sit on word boundaries
+    (so "Go" is not found inside "Google").
+    """
+    def __init__(self, keywords):
+        self.keywords = []
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        self._dict_link = [0]
+
+        for keyword in keywords:
+            self._add(keyword)
+        self._build_links()
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def _add(self, keyword):
+        pattern = keyword.strip().lower()
+        if not pattern:
+            return
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._dict_link.append(0)
+            node = nxt
+        self._output[node].append(len(self.keywords))
+        self.keywords.append((keyword.strip(), len(pattern), pattern[0].isalnum(), pattern[-1].isalnum()))
+
+    def _build_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                # Nearest suffix state that ends a keyword, so reporting never walks empty states
+                target = self._fail[child]
+                self._dict_link[child] = target if self._output[target] else self._dict_link[target]
+
+    def find_all(self, text):
+        """
+        Returns every keyword occurrence as KeywordMatch(start, end, keyword), in text order.
+        Overlapping keywords (e.g. "machine learning" and "learning") are all reported.
+        """
+        lowered = _lower_same_length(text)
+        goto, fail, output, dict_link = self._goto, self._fail, self._output, self._dict_link
+        text_len = len(lowered)
+        matches = []
+        node = 0
+        for i, ch in enumerate(lowered):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+
+            hit = node if output[node] else dict_link[node]
+            while hit:
+                for idx in output[hit]:
+                    keyword, length, bounded_start, bounded_end = self.keywords[idx]
+                    start = i - length + 1
+                    if bounded_start and start > 0 and lowered[start - 1].isalnum():
+                        continue
+                    if bounded_end and i + 1 < text_len and lowered[i + 1].isalnum():
+                        continue
+                    matches.append(KeywordMatch(start, i + 1, keyword))
+                hit = dict_link[hit]
+
+        matches.sort(key=lambda m: (m.start, -m.end))
+        return matches
+
+
+def load_skill_vocabulary(csv_file):
+    with open(csv_file, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        next(reader)  # Skip header
+        return [row[0].strip() for row in reader if row and row[0].strip()]
+
+
+@lru_cache(maxsize=None)
+def get_skill_matcher(csv_file="data/Skills.csv"):
+    """
+    Builds the skill automaton once per vocabulary file and reuses it for every resume. It looks
+    for the taxonomy's spellings of each skill, so a keyword may be an alias; pass it through
+    SkillTaxonomy.canonical() before reporting it.
+    """
+    from utilties.resume_parser.skill_taxonomy import get_skill_taxonomy
+    return KeywordAutomaton(get_skill_taxonomy(csv_file).spellings)
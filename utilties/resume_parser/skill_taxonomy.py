@@ -0,0 +1,174 @@
+import re
+from functools import lru_cache
+
+import numpy as np
+
+from utilties.resume_parser.skill_matcher import load_skill_vocabulary
+
+# Spelling differences that never change the skill: case, whitespace, dots, hyphens, underscores and
+# slashes ("Node.Js", "Nodejs" and "node js" are one skill; "C++" and "C#" keep their symbols)
+SKILL_KEY_STRIP = re.compile(r"[\s.\-_/]+")
+
+# "Natural Language Processing (NLP)": the name before the brackets, and what the brackets hold
+QUALIFIED_NAME_PATTERN = re.compile(r"^(?P<name>[^()]+?)\s*\((?P<qualifier>[^()]*)\)\s*$")
+# Bracket text that is an abbreviation of the name ("NLP", "PWAs"), not a description or an example list
+ABBREVIATION_PATTERN = re.compile(r"^[A-Z][A-Z0-9]{1,5}s?$")
+
+# Common names for vocabulary skills that no spelling rule connects
+SKILL_ALIASES = {
+    'Golang': 'Go',
+    'JS': 'JavaScript',
+    'TS': 'TypeScript',
+    'ReactJS': 'React',
+    'Postgres': 'PostgreSQL',
+    'K8s': 'Kubernetes',
+    'Sklearn': 'Scikit-learn',
+    'Azure': 'Microsoft Azure',
+    'Microservices': 'Microservices Architecture',
+    'Agile': 'Agile Methodology',
+    'Spark': 'Apache Spark',
+    'Kafka': 'Apache Kafka',
+    'Cassandra': 'Apache Cassandra',
+}
+
+
+@lru_cache(maxsize=65536)
+def skill_key(name):
+    return SKILL_KEY_STRIP.sub("", name.casefold())
+
+
+def derived_aliases(name):
+    """
+    Shorter names a qualified vocabulary entry also goes by.
+    """
+    match = QUALIFIED_NAME_PATTERN.match(name)
+    if match is None:
+        return []
+    aliases = [match.group('name')]
+    qualifier = match.group('qualifier').strip()
+    if ABBREVIATION_PATTERN.match(qualifier):
+        aliases.append(qualifier)
+    return aliases
+
+
+def display_name(name):
+    # A bracketed description is dropped ("Rust (Programming language ...)" -> "Rust"); a
+    # bracketed abbreviation is kept ("Natural Language Processing (NLP)")
+    aliases = derived_aliases(name)
+    return aliases[0] if len(aliases) == 1 else name.strip()
+
+
+class SkillTaxonomy:
+    """
+    Maps skill names to dense integer IDs: the vocabulary file gives IDs 0..vocabulary_size-1 in
+    file order, and aliases and spelling variants resolve to the same ID. The taxonomy never
+    changes after it is built; skills outside the vocabulary have no ID of their own (see encode()
+    for giving them IDs local to one index), so it does not grow with what the parsers find.
+
+    A set of skills is represented as a sorted int32 array, so comparing two sets is an
+    integer merge rather than string compares.
+    """
+    def __init__(self, names, aliases=SKILL_ALIASES):
+        self.names = []
+        self.ids = {}
+
+        names = list(names)
+        for name in names:
+            # "Kibana (Data visualization tool)" and "Kibana" are one skill
+            shown = display_name(name)
+            skill_id = self.ids.get(skill_key(shown))
+            if skill_id is None:
+                skill_id = self.ids[skill_key(shown)] = len(self.names)
+                self.names.append(shown)
+            self.ids.setdefault(skill_key(name), skill_id)
+        self.vocabulary_size = len(self.names)
+        # What the text matchers look for: a bracketed description is never written out in a
+        # resume, so "Rust (Programming language ...)" is found as "Rust", and every alias is
+        # looked for too ("K8s" finds Kubernetes)
+        self.spellings = list(self.names)
+
+        # Aliases never take over a key the vocabulary already uses
+        for name in names:
+            for alias in derived_aliases(name):
+                self.add_alias(alias, self.ids[skill_key(name)])
+        for alias, name in aliases.items():
+            skill_id = self.ids.get(skill_key(name))
+            if skill_id is not None:
+                self.add_alias(alias, skill_id)
+
+    def add_alias(self, alias, skill_id):
+        key = skill_key(alias)
+        if key not in self.ids:
+            self.ids[key] = skill_id
+            self.spellings.append(alias.strip())
+
+    def __len__(self):
+        return self.vocabulary_size
+
+    def lookup(self, name):
+        """
+        The ID of a vocabulary skill, or None.
+        """
+        return self.ids.get(skill_key(name))
+
+    def canonical(self, name, fallback=None):
+        """
+        The vocabulary spelling of a skill ("Node.Js" -> "Node.js"); other skills are spelled as
+        fallback, or as given when there is none.
+        """
+        skill_id = self.lookup(name)
+        if skill_id is not None:
+            return self.names[skill_id]
+        return fallback or name.strip()
+
+    def key(self, name):
+        """
+        Spelling- and alias-insensitive string key, stable across processes; use it wherever
+        skills are persisted or compared as strings.
+        """
+        skill_id = self.lookup(name)
+        return skill_key(self.names[skill_id]) if skill_id is not None else skill_key(name)
+
+    def canonical_set(self, names):
+        """
+        The canonical spellings of names, each skill once: vocabulary skills in ID order, then
+        the others in the order they were first given.
+        """
+        known, others = {}, {}
+        for name in names:
+            if not isinstance(name, str) or not name.strip():
+                continue
+            skill_id = self.lookup(name)
+            if skill_id is not None:
+                known.setdefault(skill_id, self.names[skill_id])
+            else:
+                others.setdefault(skill_key(name), name.strip())
+        return [known[skill_id] for skill_id in sorted(known)] + list(others.values())
+
+    def encode(self, names, local_ids=None, add_local=False):
+        """
+        The sorted, de-duplicated IDs of names as an int32 array. Names outside the vocabulary take
+        their ID from local_ids (skill key -> ID, numbered from vocabulary_size), and are added to
+        it when add_local is set; without local_ids they are left out.
+        """
+        ids = set()
+        for name in names:
+            if not isinstance(name, str) or not name.strip():
+                continue
+            skill_id = self.lookup(name)
+            if skill_id is None and local_ids is not None:
+                key = skill_key(name)
+                skill_id = local_ids.get(key)
+                if skill_id is None and add_local:
+                    skill_id = local_ids[key] = self.vocabulary_size + len(local_ids)
+            if skill_id is not None:
+                ids.add(skill_id)
+        return np.fromiter(sorted(ids), dtype=np.int32, count=len(ids))
+
+
+@lru_cache(maxsize=None)
+def get_skill_taxonomy(csv_file="data/Skills.csv"):
+    """
+    One taxonomy per vocabulary file, shared by the parser and the matchers.
+    """
+    return SkillTaxonomy(load_skill_vocabulary(csv_file))
@@ -0,0 +1,134 @@
+import hashlib
+import sqlite3
+import threading
+
+# Applied to every connection. WAL lets readers run alongside the single writer, and with WAL
+# synchronous=NORMAL is still crash-safe (only the last commits can be lost on power failure)
+SQLITE_PRAGMAS = [
+    'PRAGMA journal_mode = WAL',
+    'PRAGMA synchronous = NORMAL',
+    'PRAGMA busy_timeout = 5000',
+    'PRAGMA temp_store = MEMORY',
+    'PRAGMA cache_size = -16000',
+    'PRAGMA mmap_size = 268435456',
+]
+
+BLOB_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS resume_files (
+        digest TEXT PRIMARY KEY,
+        size INTEGER NOT NULL,
+        content BLOB NOT NULL
+    )
+'''
+
+
+def content_digest(content):
+    return hashlib.sha256(content).hexdigest()
+
+
+def connect(db_path, check_same_thread=True):
+    conn = sqlite3.connect(db_path, check_same_thread=check_same_thread)
+    conn.row_factory = sqlite3.Row
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+_local = threading.local()
+
+
+def thread_connection(db_path):
+    """
+    Returns this thread's connection to db_path, opening it on first use. Request handlers and
+    job queue workers reuse it across calls instead of paying for connect + pragmas every time.
+    Nothing closes it explicitly: it stays open for as long as the thread keeps running, so a
+    server's thread pool holds one open connection per thread and database.
+    """
+    connections = getattr(_local, 'connections', None)
+    if connections is None:
+        connections = _local.connections = {}
+    conn = connections.get(db_path)
+    if conn is None:
+        conn = connections[db_path] = connect(db_path)
+    return conn
+
+
+def release_connection(conn):
+    # Hand a reused connection back in a clean state, whatever the caller left behind
+    if conn.in_transaction:
+        conn.rollback()
+
+
+def create_blob_table(conn):
+    conn.execute(BLOB_SCHEMA)
+
+
+def store_blob(conn, content, digest=None):
+    """
+    Stores raw file bytes once per distinct content and returns their SHA-256 digest.
+    The caller owns the transaction.
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    digest = digest or content_digest(content)
+    conn.execute(
+        'INSERT OR IGNORE INTO resume_files (digest, size, content) VALUES (?, ?, ?)',
+        (digest, len(content), sqlite3.Binary(content))
+    )
+    return digest
+
+
+def load_blob(conn, digest):
+    row = conn.execute('SELECT content FROM resume_files WHERE digest = ?', (digest,)).fetchone()
+    return bytes(row[0]) if row else None
+
+
+def release_blob(conn, digest):
+    """
+    Deletes the blob with this digest once no resume points at it any more. Returns whether it
+    was deleted. The caller owns the transaction.
+    """
+    cur = conn.execute(
+        'DELETE FROM resume_files WHERE digest = ? AND NOT EXISTS (SELECT 1 FROM resumes WHERE content_digest = ?)',
+        (digest, digest)
+    )
+    return cur.rowcount > 0
+
+
+def delete_orphan_blobs(conn):
+    cur = conn.execute('DELETE FROM resume_files WHERE digest NOT IN (SELECT content_digest FROM resumes)')
+    return cur.rowcount
+
+
+def migrate_inline_content(conn, batch_size=200):
+    """
+    Moves PDF bytes from the legacy resumes.content column into resume_files and drops the column,
+    so scans over resumes stop reading them. Returns how many resumes were migrated (0 when the
+    table is already in the new layout). Needs SQLite 3.35+ for DROP COLUMN.
+    """
+    columns = {row[1] for row in conn.execute('PRAGMA table_info(resumes)')}
+    if 'content' not in columns:
+        return 0
+
+    with conn:
+        if 'content_digest' not in columns:
+            conn.execute('ALTER TABLE resumes ADD COLUMN content_digest TEXT')
+
+        migrated = 0
+        last_id = 0
+        while True:
+            rows = conn.execute(
+                'SELECT resume_id, content FROM resumes WHERE resume_id > ? ORDER BY resume_id LIMIT ?',
+                (last_id, batch_size)
+            ).fetchall()
+            if not rows:
+                break
+            conn.executemany(
+                'UPDATE resumes SET content_digest = ? WHERE resume_id = ?',
+                [(store_blob(conn, row[1] or b''), row[0]) for row in rows]
+            )
+            migrated += len(rows)
+            last_id = rows[-1][0]
+
+        conn.execute('ALTER TABLE resumes DROP COLUMN content')
+    return migrated
@@ -0,0 +1,62 @@
+import hashlib
+import os
+
+CHUNK_SIZE = 64 * 1024
+
+
+class UploadTooLarge(ValueError):
+    pass
+
+
+class SpooledUpload:
+    """
+    An uploaded file read exactly once into memory, hashed while it streams in.
+
+    buffer is handed as-is to fitz.open(stream=...) and to SQLite, and digest is reused as the
+    parse-cache and blob-store key, so nothing downstream has to copy or rehash the bytes.
+    """
+    def __init__(self, filename, buffer, digest):
+        self.filename = filename
+        self.buffer = buffer
+        self.digest = digest
+
+    @property
+    def size(self):
+        return len(self.buffer)
+
+    def view(self):
+        return memoryview(self.buffer)
+
+    def persist(self, folder):
+        """
+        Writes the upload to folder/<digest>.pdf, once per distinct content. Returns the path.
+        """
+        path = os.path.join(folder, f"{self.digest}.pdf")
+        if not os.path.exists(path):
+            # Write then rename so a concurrent upload of the same file never sees a partial PDF
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(self.buffer)
+            os.replace(tmp_path, path)
+        return path
+
+
+def spool_stream(stream, filename, max_bytes, expected_size=None, chunk_size=CHUNK_SIZE):
+    """
+    Reads a file-like stream in chunks into a SpooledUpload, failing with UploadTooLarge as soon as
+    more than max_bytes have arrived (or up front when the declared size is already too big).
+    """
+    if expected_size is not None and expected_size > max_bytes:
+        raise UploadTooLarge(f"Upload of {expected_size} bytes exceeds the {max_bytes} byte limit")
+
+    hasher = hashlib.sha256()
+    buffer = bytearray()
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        if len(buffer) + len(chunk) > max_bytes:
+            raise UploadTooLarge(f"Upload exceeds the {max_bytes} byte limit")
+        hasher.update(chunk)
+        buffer += chunk
+    return SpooledUpload(filename, buffer, hasher.hexdigest())